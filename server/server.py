@@ -7,13 +7,14 @@ Qt overlay client. Endpoints are intentionally thin and delegate state ownership
 
 from __future__ import annotations
 
+import hashlib
 import threading
 from pathlib import Path
 from typing import Any
 
 import uvicorn
-from fastapi import Body, FastAPI
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi import Body, FastAPI, Request
+from fastapi.responses import HTMLResponse, JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 
 from server.server_html_contents import get_index_html
@@ -37,6 +38,19 @@ def _parse_bool(value: Any) -> bool | None:
     return None
 
 
+def _json_with_etag(request: Request, payload: Any) -> Response:
+    """
+    Return `payload` as JSON with a strong ETag, or an empty 304 when the client's
+    If-None-Match already names this exact body (lets pollers skip download + parse).
+    """
+    resp = JSONResponse(payload)
+    etag = '"' + hashlib.blake2b(resp.body, digest_size=8).hexdigest() + '"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    resp.headers["ETag"] = etag
+    return resp
+
+
 def create_app(store: StatusStore, on_settings_changed=None) -> FastAPI:
     """
     Build the FastAPI application.
@@ -44,7 +58,7 @@ def create_app(store: StatusStore, on_settings_changed=None) -> FastAPI:
     Responsibilities:
     - Serve the browser UI (HTML + static assets).
     - Expose JSON endpoints consumed by the UI and by external clients:
-        /status, /history, /tiles, /ui, /ui/tile-numbers, /quit
+        /status, /history, /tiles, /ui, /ui/state, /ui/tile-numbers, /quit
     - Keep all state in StatusStore so routes remain thin and deterministic.
 
     Notes:
@@ -70,14 +84,14 @@ def create_app(store: StatusStore, on_settings_changed=None) -> FastAPI:
         return HTMLResponse(get_index_html(history_seconds=int(store.get_history_seconds())))
 
     @app.get("/ui")
-    async def get_ui() -> JSONResponse:
+    async def get_ui(request: Request) -> Response:
         """
         Return UI settings used by the browser client.
 
         This endpoint exists so the UI can initialize toggles/state even before it has
-        fetched /status successfully.
+        fetched /status successfully. Supports If-None-Match (304) for pollers.
         """
-        return JSONResponse(store.get_ui_settings())
+        return _json_with_etag(request, store.get_ui_settings())
 
     @app.post("/ui/tile-numbers")
     async def ui_tile_numbers(body: dict[str, Any] = Body(default={})) -> JSONResponse:
@@ -177,14 +191,24 @@ def create_app(store: StatusStore, on_settings_changed=None) -> FastAPI:
         """
         return JSONResponse({"disabled_tiles": store.get_disabled_tiles()})
 
+    @app.get("/ui/state")
+    async def ui_state(request: Request) -> Response:
+        """
+        UI settings plus disabled tiles in one payload.
+
+        Lets the overlay poll a single endpoint per cycle instead of /ui and /tiles separately.
+        Supports If-None-Match (304) like /ui.
+        """
+        return _json_with_etag(request, {**store.get_ui_settings(), "disabled_tiles": store.get_disabled_tiles()})
+
     @app.get("/ui/settings")
-    async def ui_settings() -> JSONResponse:
+    async def ui_settings(request: Request) -> Response:
         """
         Compatibility alias for UI settings.
 
         Some older clients may call /ui/settings instead of /ui.
         """
-        return JSONResponse(store.get_ui_settings())
+        return _json_with_etag(request, store.get_ui_settings())
 
     @app.put("/tiles")
     async def put_tiles(body: dict[str, Any] = Body(...)) -> JSONResponse:
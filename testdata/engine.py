@@ -5,8 +5,9 @@ from __future__ import annotations
 from dataclasses import dataclass
 import math
 import random
-from typing import Optional, Tuple
+from typing import Callable, ClassVar, Optional, Tuple
 
+import cv2
 import numpy as np
 
 from testdata.profile import TestDataProfile
@@ -23,6 +24,92 @@ def _lerp(a: float, b: float, t: float) -> float:
     return a + (b - a) * t
 
 
+def _add_sat(frame: np.ndarray, delta: np.ndarray | int) -> np.ndarray:
+    """Saturating uint8 add of an int16 delta array or a scalar, fused into one OpenCV pass."""
+    if isinstance(delta, np.ndarray):
+        return cv2.add(frame, delta, dtype=cv2.CV_8U)
+    d = float(delta)
+    return cv2.add(frame, (d, d, d, 0.0))
+
+
+_DISK_MASKS: dict[int, np.ndarray] = {}
+
+
+def _disk_mask(r: int) -> np.ndarray:
+    """Return the cached (2r+1, 2r+1) boolean disk mask for radius r."""
+    mask = _DISK_MASKS.get(r)
+    if mask is None:
+        dy, dx = np.ogrid[-r : r + 1, -r : r + 1]
+        mask = (dx * dx + dy * dy) <= (r * r)
+        _DISK_MASKS[r] = mask
+    return mask
+
+
+# Per-variant constants for the streaming realism scenes (19–30), bound once per scene in _init_scene.
+_VARIANT_PARAMS: dict[int, dict[str, dict[str, float]]] = {
+    19: {  # long black with subtle noise
+        "v1": {"base": 0, "amp": 1, "period_s": 0.45},
+        "v2": {"base": 0, "amp": 2, "period_s": 0.30},
+        "v3": {"base": 2, "amp": 3, "period_s": 0.18},
+    },
+    20: {  # logo bug
+        "v1": {"toggle_s": 2.5, "toggle_p": 0.35, "flicker_p": 0.0},
+        "v2": {"toggle_s": 1.2, "toggle_p": 0.55, "flicker_p": 0.10},
+        "v3": {"toggle_s": 0.6, "toggle_p": 0.75, "flicker_p": 0.10},
+    },
+    21: {  # captions fade
+        "v1": {"speed": 0.30},
+        "v2": {"speed": 0.55},
+        "v3": {"speed": 0.90},
+    },
+    22: {  # ticker crawl
+        "v1": {"speed": 30.0},
+        "v2": {"speed": 60.0},
+        "v3": {"speed": 95.0},
+    },
+    23: {  # film grain
+        "v1": {"amp": 2, "period_s": 0.25},
+        "v2": {"amp": 4, "period_s": 0.16},
+        "v3": {"amp": 7, "period_s": 0.10},
+    },
+    24: {  # brightness pump
+        "v1": {"rate": 0.35, "pump": 0.06},
+        "v2": {"rate": 0.65, "pump": 0.10},
+        "v3": {"rate": 1.10, "pump": 0.16},
+    },
+    25: {  # loading spinner
+        "v1": {"radius_frac": 0.06, "speed_rps": 0.6, "dots": 8},
+        "v2": {"radius_frac": 0.08, "speed_rps": 1.2, "dots": 12},
+        "v3": {"radius_frac": 0.05, "speed_rps": 2.2, "dots": 10},
+    },
+    26: {  # hard cuts
+        "v1": {"period_s": 6.0, "spike_s": 0.35, "amp": 10},
+        "v2": {"period_s": 4.0, "spike_s": 0.45, "amp": 20},
+        "v3": {"period_s": 2.5, "spike_s": 0.55, "amp": 35},
+    },
+    27: {  # freeze with refresh
+        "v1": {"refresh_s": 6.0, "blocks": 6, "amp": 10, "mb": 16},
+        "v2": {"refresh_s": 3.0, "blocks": 14, "amp": 18, "mb": 16},
+        "v3": {"refresh_s": 1.5, "blocks": 28, "amp": 28, "mb": 8},
+    },
+    28: {  # detailed pan
+        "v1": {"speed": 0.08, "flash_p": 0.0},
+        "v2": {"speed": 0.14, "flash_p": 0.0},
+        "v3": {"speed": 0.22, "flash_p": 0.03},
+    },
+    29: {  # gradient shimmer
+        "v1": {"amp": 1, "period_s": 0.50},
+        "v2": {"amp": 2, "period_s": 0.33},
+        "v3": {"amp": 3, "period_s": 0.22},
+    },
+    30: {  # scrolling credits
+        "v1": {"speed": 14.0, "columns": 2},
+        "v2": {"speed": 24.0, "columns": 2},
+        "v3": {"speed": 34.0, "columns": 3},
+    },
+}
+
+
 @dataclass(frozen=True)
 class SubtitleOverlay:
     text: str
@@ -47,6 +134,9 @@ class FrameOut:
     audio_pattern: str = ""
 
 
+_SceneRenderer = Callable[["TestDataEngine", int, float], tuple[np.ndarray, Optional[SubtitleOverlay]]]
+
+
 class TestDataEngine:
     """
     Synthetic "streaming-like" scene generator used to drive the detector and collect tuning logs.
@@ -110,6 +200,11 @@ class TestDataEngine:
         self._static_texture: Optional[np.ndarray] = None
         self._static_texture_seed = 0
 
+        # variant tag per streaming-realism scene (19..30); depends only on the texture seed
+        self._tags: dict[int, str] = {}
+        # constants of the active scene's variant (see _VARIANT_PARAMS)
+        self._vp: dict[str, float] = {}
+
         # grain state
         self._grain_seed = 0
         self._grain_next_update_s = 0.0
@@ -118,6 +213,7 @@ class TestDataEngine:
         # decoder/macroblock style noise
         self._mb_seed = 0
         self._mb_cache: Optional[np.ndarray] = None
+        self._mb_offset: Optional[int] = None  # uniform offset (scene 19)
         self._mb_next_update_s = 0.0
 
         # logo bug state (static logo that may flicker)
@@ -148,11 +244,21 @@ class TestDataEngine:
         self._dpan_base: Optional[np.ndarray] = None
         self._dpan_u = 0.0
 
+        # cached flat backgrounds keyed by fill value (read-only, rebuilt only on resize)
+        self._flat_frames: dict[int, np.ndarray] = {}
+
+        # reusable int16 scratch for per-block saturating adds
+        self._block_scratch: Optional[np.ndarray] = None
+
+        # gradient shimmer state (static horizontal ramp, rebuilt only on resize)
+        self._grad_frame: Optional[np.ndarray] = None
+
         # film grain / brightness pump state
         self._pump_phase = 0.0
 
         # spinner state (streaming realism)
         self._spinner_phase = 0.0
+        self._dot_angles_by_dots: dict[int, np.ndarray] = {}
 
         # audio synthesis state
         self._audio_sample_rate_hz = 48_000
@@ -207,6 +313,7 @@ class TestDataEngine:
         self._pan_base = None
         self._static_texture = None
         self._mb_cache = None
+        self._mb_offset = None
         self._grain_cache = None
         self._cut_a = None
         self._cut_b = None
@@ -290,7 +397,7 @@ class TestDataEngine:
     def _scene_name(self, idx1: int) -> str:
         """Scene name."""
         if idx1 >= 19:
-            return f"{self._scene_name_base(idx1)} ({self._variant_tag(idx1)})"
+            return f"{self._scene_name_base(idx1)} ({self._tags[idx1]})"
         return self._scene_name_base(idx1)
 
     def _scene_name_base(self, idx1: int) -> str:
@@ -348,7 +455,7 @@ class TestDataEngine:
             within = float(self._scene_t - (cut_i * per))
             return f"cut={cut_i} phase={'cut' if within < self._cut_spike_s() else 'stable'}"
         if idx1 >= 19:
-            return self._variant_tag(idx1)
+            return self._tags[idx1]
         return ""
 
     def _audio_pattern_name(self, idx1: int) -> str:
@@ -440,6 +547,7 @@ class TestDataEngine:
             self._noise_phase_seed = self._rng.randrange(1, 2**31 - 1)
             self._mb_seed = self._rng.randrange(1, 2**31 - 1)
             self._mb_cache = None
+            self._mb_offset = None
             self._mb_next_update_s = 0.0
             self._grain_seed = self._rng.randrange(1, 2**31 - 1)
             self._grain_cache = None
@@ -477,79 +585,64 @@ class TestDataEngine:
         # base texture seed changes per scene to keep variety but determinism
         self._static_texture_seed = (idx1 * 9973) ^ 0xA5A5A5
         self._static_texture = None
+        self._tags = {k: self._variant_tag(k) for k in range(19, 31)}
+        self._vp = _VARIANT_PARAMS[idx1][self._tags[idx1]] if idx1 in _VARIANT_PARAMS else {}
 
     # ---------------- render dispatch ----------------
 
     def _render_scene(self, *, scene0: int, dt: float) -> tuple[np.ndarray, Optional[SubtitleOverlay]]:
         """Scene."""
-        idx1 = scene0 + 1
-
-        if idx1 == 1:
-            return self._scene_pixels(target="below_no_motion"), None
-        if idx1 == 2:
-            return self._scene_pixels(target="below_low_activity"), None
-        if idx1 == 3:
-            return self._scene_pixels(target="above_low_activity"), None
-        if idx1 == 4:
-            per = self._durations[scene0] / 3.0
-            p = int(self._scene_t // per) % 3
-            tgt = "below_no_motion" if p == 0 else "below_low_activity" if p == 1 else "above_low_activity"
-            return self._scene_pixels(target=tgt), None
-        if idx1 == 5:
-            return self._scene_fade(), None
-        if idx1 == 6:
-            return self._scene_subtitles_blocky(fg="white", bg="black", dt=dt), None
-        if idx1 == 7:
-            return self._scene_subtitles_blocky(fg="black", bg="white", dt=dt), None
-        if idx1 == 8:
-            return self._scene_static_regions(), None
-        if idx1 == 9:
-            return self._scene_spinner(), None
-        if idx1 == 10:
-            return self._scene_real_subtitles_fade(fg="white", bg="black"), self._subtitle_overlay(fg="white", bg="black", fade=True)
-        if idx1 == 11:
-            return self._scene_real_subtitles_fade(fg="black", bg="white"), self._subtitle_overlay(fg="black", bg="white", fade=True)
-        if idx1 == 12:
-            return self._scene_pixel_size_calibration(), None
-        if idx1 == 13:
-            return self._scene_one_tile_sweep(), None
-        if idx1 == 14:
-            return self._scene_slow_pan(), None
-        if idx1 == 15:
-            return self._scene_compression_noise(mode="below_no"), None
-        if idx1 == 16:
-            return self._scene_compression_noise(mode="between"), None
-        if idx1 == 17:
-            return self._scene_black_with_blink(dt=dt), None
-        if idx1 == 18:
-            return self._scene_subtitle_crawl(dt=dt), self._subtitle_crawl_overlay()
-
-        if idx1 == 19:
-            return self._scene_long_black_with_noise(dt=dt), None
-        if idx1 == 20:
-            return self._scene_logo_bug(dt=dt), None
-        if idx1 == 21:
-            return self._scene_captions_fade(dt=dt), self._captions_overlay()
-        if idx1 == 22:
-            return self._scene_ticker_crawl(dt=dt), self._ticker_overlay()
-        if idx1 == 23:
-            return self._scene_film_grain(dt=dt), None
-        if idx1 == 24:
-            return self._scene_brightness_pump(dt=dt), None
-        if idx1 == 25:
-            return self._scene_loading_spinner(dt=dt), None
-        if idx1 == 26:
-            return self._scene_hard_cuts(dt=dt), None
-        if idx1 == 27:
-            return self._scene_freeze_with_refresh(dt=dt), None
-        if idx1 == 28:
-            return self._scene_detailed_pan(dt=dt), None
-        if idx1 == 29:
-            return self._scene_gradient_shimmer(dt=dt), None
-        if idx1 == 30:
-            return self._scene_scrolling_credits(dt=dt), None
-
-        return np.zeros((self._h, self._w, 3), dtype=np.uint8), None
+        render = self._SCENE_DISPATCH.get(scene0 + 1)
+        if render is None:
+            return np.zeros((self._h, self._w, 3), dtype=np.uint8), None
+        return render(self, scene0, dt)
+
+    def _scene_alternating_pixels(self, *, scene0: int) -> np.ndarray:
+        """Scene 4: cycle the pixel targets through NO / LOW / MOTION in thirds of the scene."""
+        per = self._durations[scene0] / 3.0
+        p = int(self._scene_t // per) % 3
+        tgt = "below_no_motion" if p == 0 else "below_low_activity" if p == 1 else "above_low_activity"
+        return self._scene_pixels(target=tgt)
+
+    # scene index (1-based) -> renderer(self, scene0, dt); one dict lookup per frame
+    _SCENE_DISPATCH: ClassVar[dict[int, _SceneRenderer]] = {
+        1: lambda self, scene0, dt: (self._scene_pixels(target="below_no_motion"), None),
+        2: lambda self, scene0, dt: (self._scene_pixels(target="below_low_activity"), None),
+        3: lambda self, scene0, dt: (self._scene_pixels(target="above_low_activity"), None),
+        4: lambda self, scene0, dt: (self._scene_alternating_pixels(scene0=scene0), None),
+        5: lambda self, scene0, dt: (self._scene_fade(), None),
+        6: lambda self, scene0, dt: (self._scene_subtitles_blocky(fg="white", bg="black", dt=dt), None),
+        7: lambda self, scene0, dt: (self._scene_subtitles_blocky(fg="black", bg="white", dt=dt), None),
+        8: lambda self, scene0, dt: (self._scene_static_regions(), None),
+        9: lambda self, scene0, dt: (self._scene_spinner(), None),
+        10: lambda self, scene0, dt: (
+            self._scene_real_subtitles_fade(fg="white", bg="black"),
+            self._subtitle_overlay(fg="white", bg="black", fade=True),
+        ),
+        11: lambda self, scene0, dt: (
+            self._scene_real_subtitles_fade(fg="black", bg="white"),
+            self._subtitle_overlay(fg="black", bg="white", fade=True),
+        ),
+        12: lambda self, scene0, dt: (self._scene_pixel_size_calibration(), None),
+        13: lambda self, scene0, dt: (self._scene_one_tile_sweep(), None),
+        14: lambda self, scene0, dt: (self._scene_slow_pan(), None),
+        15: lambda self, scene0, dt: (self._scene_compression_noise(mode="below_no"), None),
+        16: lambda self, scene0, dt: (self._scene_compression_noise(mode="between"), None),
+        17: lambda self, scene0, dt: (self._scene_black_with_blink(dt=dt), None),
+        18: lambda self, scene0, dt: (self._scene_subtitle_crawl(dt=dt), self._subtitle_crawl_overlay()),
+        19: lambda self, scene0, dt: (self._scene_long_black_with_noise(dt=dt), None),
+        20: lambda self, scene0, dt: (self._scene_logo_bug(dt=dt), None),
+        21: lambda self, scene0, dt: (self._scene_captions_fade(dt=dt), self._captions_overlay()),
+        22: lambda self, scene0, dt: (self._scene_ticker_crawl(dt=dt), self._ticker_overlay()),
+        23: lambda self, scene0, dt: (self._scene_film_grain(dt=dt), None),
+        24: lambda self, scene0, dt: (self._scene_brightness_pump(dt=dt), None),
+        25: lambda self, scene0, dt: (self._scene_loading_spinner(dt=dt), None),
+        26: lambda self, scene0, dt: (self._scene_hard_cuts(dt=dt), None),
+        27: lambda self, scene0, dt: (self._scene_freeze_with_refresh(dt=dt), None),
+        28: lambda self, scene0, dt: (self._scene_detailed_pan(dt=dt), None),
+        29: lambda self, scene0, dt: (self._scene_gradient_shimmer(dt=dt), None),
+        30: lambda self, scene0, dt: (self._scene_scrolling_credits(dt=dt), None),
+    }
 
     def _render_audio(self, *, scene0: int, dt: float) -> np.ndarray:
         """Render a stereo audio chunk aligned with the current video frame."""
@@ -684,10 +777,12 @@ class TestDataEngine:
                     jitter[mask] = jitter_vals
                 self._no_motion_noise = jitter
 
-            base = np.zeros((self._h, self._w, 3), dtype=np.uint8)
+            out = np.zeros((self._h, self._w, 3), dtype=np.uint8)
             if self._no_motion_noise is None:
-                return base
-            return np.clip(base.astype(np.int16) + self._no_motion_noise[:, :, None], 0, 255).astype(np.uint8)
+                return out
+            # base is black, so base + noise is just the noise clipped into the output buffer
+            np.clip(self._no_motion_noise[:, :, None], 0, 255, out=out, casting="unsafe")
+            return out
 
         # ------------------------------------------------------------
         # NEW: controlled sparse noise for LOW/MOTION targets
@@ -743,11 +838,12 @@ class TestDataEngine:
 
             self._px_field = field
 
-        base = np.zeros((self._h, self._w, 3), dtype=np.uint8)
+        out = np.zeros((self._h, self._w, 3), dtype=np.uint8)
         if self._px_field is None:
-            return base
+            return out
 
-        return np.clip(base.astype(np.int16) + self._px_field[:, :, None], 0, 255).astype(np.uint8)
+        np.clip(self._px_field[:, :, None], 0, 255, out=out, casting="unsafe")
+        return out
 
 
     def _scene_fade(self) -> np.ndarray:
@@ -854,16 +950,10 @@ class TestDataEngine:
     def _scene_compression_noise(self, *, mode: str) -> np.ndarray:
         """Scene compression noise."""
         frame = np.zeros((self._h, self._w, 3), dtype=np.uint8)
-        mb = 16
-        rng = random.Random(self._noise_phase_seed + int(self._scene_t * 3.0) + (15_000 if mode == "between" else 10_000))
+        rng = np.random.default_rng(int(self._noise_phase_seed) + int(self._scene_t * 3.0) + (15_000 if mode == "between" else 10_000))
         amp = 1 if mode == "below_no" else 3
-        for by in range(0, self._h, mb):
-            for bx in range(0, self._w, mb):
-                dv = rng.randint(-amp, amp)
-                if dv == 0:
-                    continue
-                block = frame[by : min(self._h, by + mb), bx : min(self._w, bx + mb), :].astype(np.int16)
-                frame[by : min(self._h, by + mb), bx : min(self._w, bx + mb), :] = np.clip(block + dv, 0, 255).astype(np.uint8)
+        # black base: adding the block offsets and saturating is just clipping them into the frame
+        np.clip(self._block_noise(rng, amp=amp, mb=16)[:, :, None], 0, 255, out=frame, casting="unsafe")
         return frame
 
     def _scene_black_with_blink(self, *, dt: float) -> np.ndarray:
@@ -919,6 +1009,8 @@ class TestDataEngine:
         """Return the current static texture value for callers."""
         if self._static_texture is None:
             self._static_texture = self._make_static_texture(seed=self._static_texture_seed, contrast=100)
+            # shared with scenes that return it as-is; callers that draw on it must copy first
+            self._static_texture.setflags(write=False)
         return self._static_texture
 
     def _make_static_texture(self, *, seed: int, contrast: int) -> np.ndarray:
@@ -942,53 +1034,32 @@ class TestDataEngine:
 
         return base
 
-    def _grain_amp(self) -> int:
-        """Grain amp."""
-        vtag = self._variant_tag(23)
-        return 2 if vtag == "v1" else 4 if vtag == "v2" else 7
-
-    def _grain_period_s(self) -> float:
-        """Grain period s."""
-        vtag = self._variant_tag(23)
-        return 0.25 if vtag == "v1" else 0.16 if vtag == "v2" else 0.10
-
-    def _mb_amp(self) -> int:
-        """Mb amp."""
-        vtag = self._variant_tag(29)
-        return 1 if vtag == "v1" else 2 if vtag == "v2" else 3
-
-    def _mb_period_s(self) -> float:
-        """Mb period s."""
-        vtag = self._variant_tag(29)
-        return 0.50 if vtag == "v1" else 0.33 if vtag == "v2" else 0.22
-
     def _scene_long_black_with_noise(self, *, dt: float) -> np.ndarray:
         """Scene long black with noise."""
-        vtag = self._variant_tag(19)
-        base = 0 if vtag != "v3" else 2
-        frame = np.full((self._h, self._w, 3), base, dtype=np.uint8)
-
-        amp = 1 if vtag == "v1" else 2 if vtag == "v2" else 3
-        period = 0.45 if vtag == "v1" else 0.30 if vtag == "v2" else 0.18
+        vp = self._vp
+        base = int(vp["base"])
+        amp = int(vp["amp"])
+        period = vp["period_s"]
 
         if self._scene_t >= self._mb_next_update_s:
             self._mb_next_update_s = self._scene_t + period
-            rng = random.Random(self._mb_seed + int(self._scene_t * 1000.0) + 19_000)
-            self._mb_cache = (rng.randint(-amp, amp) * np.ones((self._h, self._w, 3), dtype=np.int16))
+            rng = np.random.default_rng(int(self._mb_seed) + int(self._scene_t * 1000.0) + 19_000)
+            self._mb_offset = int(rng.integers(-amp, amp + 1))
 
-        if self._mb_cache is not None:
-            out = np.clip(frame.astype(np.int16) + self._mb_cache, 0, 255).astype(np.uint8)
-            return out
+        # the frame is a flat field, so the noise offset folds into the fill value
+        if self._mb_offset is not None:
+            base = max(0, min(255, base + self._mb_offset))
 
-        return frame
+        return np.full((self._h, self._w, 3), base, dtype=np.uint8)
 
     def _scene_logo_bug(self, *, dt: float) -> np.ndarray:
         """Scene logo bug."""
         frame = self._get_static_texture().copy()
 
+        vp = self._vp
         if self._scene_t >= self._logo_next_toggle_s:
-            self._logo_next_toggle_s = self._scene_t + (2.5 if self._variant_tag(20) == "v1" else 1.2 if self._variant_tag(20) == "v2" else 0.6)
-            if self._rng.random() < (0.35 if self._variant_tag(20) == "v1" else 0.55 if self._variant_tag(20) == "v2" else 0.75):
+            self._logo_next_toggle_s = self._scene_t + vp["toggle_s"]
+            if self._rng.random() < vp["toggle_p"]:
                 self._logo_on = not self._logo_on
 
         if self._logo_on:
@@ -996,18 +1067,18 @@ class TestDataEngine:
             y0 = int(self._h * 0.06)
             self._rect(frame, x0, y0, x0 + int(self._w * 0.12), y0 + int(self._h * 0.08), 240)
 
-            if self._variant_tag(20) != "v1" and self._rng.random() < 0.10:
+            flicker_p = vp["flicker_p"]
+            if flicker_p > 0.0 and self._rng.random() < flicker_p:
                 self._rect(frame, x0, y0, x0 + int(self._w * 0.12), y0 + int(self._h * 0.08), 210)
 
         return frame
 
     def _scene_captions_fade(self, *, dt: float) -> np.ndarray:
         """Scene captions fade."""
-        frame = self._get_static_texture().copy()
+        # captions are drawn as an overlay; the frame itself is the untouched static texture
+        frame = self._get_static_texture()
 
-        vtag = self._variant_tag(21)
-        speed = 0.30 if vtag == "v1" else 0.55 if vtag == "v2" else 0.90
-        self._cap_alpha += float(self._cap_dir) * speed * dt
+        self._cap_alpha += float(self._cap_dir) * self._vp["speed"] * dt
         if self._cap_alpha >= 1.0:
             self._cap_alpha = 1.0
             self._cap_dir = -1.0
@@ -1030,11 +1101,10 @@ class TestDataEngine:
 
     def _scene_ticker_crawl(self, *, dt: float) -> np.ndarray:
         """Scene ticker crawl."""
-        frame = self._get_static_texture().copy()
+        # the ticker text is drawn as an overlay; the frame itself is the untouched static texture
+        frame = self._get_static_texture()
 
-        vtag = self._variant_tag(22)
-        speed = 30.0 if vtag == "v1" else 60.0 if vtag == "v2" else 95.0
-        self._ticker_x -= speed * dt
+        self._ticker_x -= self._vp["speed"] * dt
         if self._ticker_x < -float(self._w) * 1.1:
             self._ticker_x = float(self._w)
         return frame
@@ -1051,61 +1121,64 @@ class TestDataEngine:
 
     def _scene_film_grain(self, *, dt: float) -> np.ndarray:
         """Scene film grain."""
-        frame = np.full((self._h, self._w, 3), 10, dtype=np.uint8)
+        bg = 10
 
         if self._scene_t >= self._grain_next_update_s:
-            self._grain_next_update_s = self._scene_t + float(self._grain_period_s())
+            self._grain_next_update_s = self._scene_t + self._vp["period_s"]
             rng = np.random.default_rng(int(self._grain_seed) + int(self._scene_t * 1000.0) + 23_000)
-            amp = int(self._grain_amp())
-            self._grain_cache = rng.integers(-amp, amp + 1, size=(self._h, self._w, 1), dtype=np.int16).repeat(3, axis=2)
+            amp = int(self._vp["amp"])
+            self._grain_cache = rng.integers(-amp, amp + 1, size=(self._h, self._w, 1), dtype=np.int16)
 
         if self._grain_cache is None:
-            return frame
+            return self._get_flat_frame(bg)
 
-        out = np.clip(frame.astype(np.int16) + self._grain_cache, 0, 255).astype(np.uint8)
-        return out
+        # grain is monochrome on a flat grey field: add on one plane, then expand to RGB
+        plane = cv2.add(self._grain_cache, (float(bg), float(bg), float(bg), 0.0), dtype=cv2.CV_8U)
+        return cv2.cvtColor(plane, cv2.COLOR_GRAY2RGB)
 
     def _scene_brightness_pump(self, *, dt: float) -> np.ndarray:
         """Scene brightness pump."""
-        base = self._get_static_texture().copy()
-        vtag = self._variant_tag(24)
+        base = self._get_static_texture()
+        vp = self._vp
 
-        self._pump_phase += (0.35 if vtag == "v1" else 0.65 if vtag == "v2" else 1.10) * dt
-        pump = 0.06 if vtag == "v1" else 0.10 if vtag == "v2" else 0.16
-        gain = 1.0 + pump * math.sin(2.0 * math.pi * self._pump_phase)
+        self._pump_phase += vp["rate"] * dt
+        gain = 1.0 + vp["pump"] * math.sin(2.0 * math.pi * self._pump_phase)
 
-        out = np.clip(base.astype(np.float32) * float(gain), 0.0, 255.0).astype(np.uint8)
-        return out
+        # saturating 8-bit scale in one pass (gain is always positive, so the abs() is a no-op)
+        return cv2.convertScaleAbs(base, alpha=float(gain))
 
     def _scene_loading_spinner(self, *, dt: float) -> np.ndarray:
         """Scene loading spinner."""
-        vtag = self._variant_tag(25)
+        vp = self._vp
         frame = self._get_static_texture().copy()
 
-        r = int(min(self._w, self._h) * (0.06 if vtag == "v1" else 0.08 if vtag == "v2" else 0.05))
-        speed_rps = 0.6 if vtag == "v1" else 1.2 if vtag == "v2" else 2.2
-        dots = 8 if vtag == "v1" else 12 if vtag == "v2" else 10
+        r = int(min(self._w, self._h) * vp["radius_frac"])
+        speed_rps = vp["speed_rps"]
+        dots = int(vp["dots"])
 
         self._spinner_phase += float(speed_rps) * (2.0 * math.pi) * dt
         cx, cy = int(self._w * 0.50), int(self._h * 0.55)
 
+        angles = self._dot_angles_by_dots.get(dots)
+        if angles is None:
+            angles = np.arange(dots) * (2.0 * math.pi / float(dots))
+            self._dot_angles_by_dots[dots] = angles
+        a = self._spinner_phase + angles
+        xs = (cx + np.round(r * np.cos(a))).astype(int).tolist()
+        ys = (cy + np.round(r * np.sin(a))).astype(int).tolist()
+
         for k in range(dots):
-            a = self._spinner_phase + (k * (2.0 * math.pi / float(dots)))
-            x = cx + int(round(r * math.cos(a)))
-            y = cy + int(round(r * math.sin(a)))
             v = 255 if k == 0 else 120
-            self._dot(frame, x, y, 2, v)
+            self._dot(frame, xs[k], ys[k], 2, v)
         return frame
 
     def _cut_period_s(self) -> float:
         """Cut period s."""
-        vtag = self._variant_tag(26)
-        return 6.0 if vtag == "v1" else 4.0 if vtag == "v2" else 2.5
+        return self._vp["period_s"]
 
     def _cut_spike_s(self) -> float:
         """Cut spike s."""
-        vtag = self._variant_tag(26)
-        return 0.35 if vtag == "v1" else 0.45 if vtag == "v2" else 0.55
+        return self._vp["spike_s"]
 
     def _scene_hard_cuts(self, *, dt: float) -> np.ndarray:
         """Scene hard cuts."""
@@ -1117,22 +1190,19 @@ class TestDataEngine:
         cut_i = int(self._scene_t // per)
         within = float(self._scene_t - (cut_i * per))
         cur = self._cut_a if (cut_i % 2 == 0) else self._cut_b
-        out = cur.copy()
 
         if within < self._cut_spike_s():
-            vtag = self._variant_tag(26)
-            amp = 10 if vtag == "v1" else 20 if vtag == "v2" else 35
-            out = np.clip(out.astype(np.int16) + amp, 0, 255).astype(np.uint8)
+            return _add_sat(cur, int(self._vp["amp"]))
 
-        return out
+        return cur.copy()
 
     def _scene_freeze_with_refresh(self, *, dt: float) -> np.ndarray:
         """Scene freeze with refresh."""
-        vtag = self._variant_tag(27)
-        refresh_period = 6.0 if vtag == "v1" else 3.0 if vtag == "v2" else 1.5
-        blocks = 6 if vtag == "v1" else 14 if vtag == "v2" else 28
-        amp = 10 if vtag == "v1" else 18 if vtag == "v2" else 28
-        mb = 16 if vtag != "v3" else 8
+        vp = self._vp
+        refresh_period = vp["refresh_s"]
+        blocks = int(vp["blocks"])
+        amp = int(vp["amp"])
+        mb = int(vp["mb"])
 
         if self._freeze_base is None:
             self._freeze_base = self._make_static_texture(seed=self._freeze_phase_seed, contrast=95).copy()
@@ -1141,100 +1211,136 @@ class TestDataEngine:
 
         if (self._scene_t - self._freeze_last_refresh_s) >= refresh_period:
             self._freeze_last_refresh_s = float(self._scene_t)
-            rng = random.Random(self._noise_phase_seed + int(self._scene_t * 10.0) + 27_000)
-            for _ in range(blocks):
-                bx = rng.randrange(0, max(1, self._w // mb)) * mb
-                by = rng.randrange(0, max(1, self._h // mb)) * mb
-                dv = rng.randint(-amp, amp)
-                block = out[by : min(self._h, by + mb), bx : min(self._w, bx + mb), :].astype(np.int16)
-                out[by : min(self._h, by + mb), bx : min(self._w, bx + mb), :] = np.clip(block + dv, 0, 255).astype(np.uint8)
+            rng = np.random.default_rng(int(self._noise_phase_seed) + int(self._scene_t * 10.0) + 27_000)
+            bx = rng.integers(0, max(1, self._w // mb), size=blocks) * mb
+            by = rng.integers(0, max(1, self._h // mb), size=blocks) * mb
+            dv = rng.integers(-amp, amp + 1, size=blocks)
+            self._apply_blocks(out, bx, by, dv, mb)
 
         return out
 
     def _scene_detailed_pan(self, *, dt: float) -> np.ndarray:
         """Scene detailed pan."""
-        vtag = self._variant_tag(28)
+        vp = self._vp
         if self._dpan_base is None:
             self._dpan_base = self._make_static_texture(seed=44_444, contrast=160).copy()
 
-        speed = 0.08 if vtag == "v1" else 0.14 if vtag == "v2" else 0.22
-        self._dpan_u = float(self._dpan_u + speed * dt)
+        self._dpan_u = float(self._dpan_u + vp["speed"] * dt)
 
         dx = int(round((math.sin(2.0 * math.pi * self._dpan_u) * 0.35 + 0.5) * (self._w * 0.12)))
         dy = int(round((math.cos(2.0 * math.pi * self._dpan_u) * 0.35 + 0.5) * (self._h * 0.08)))
 
         base = self._dpan_base
-        out = np.zeros_like(base)
-        sx0 = dx % self._w
-        sy0 = dy % self._h
+        sx = dx % self._w
+        sy = dy % self._h
+        wx = self._w - sx
+        hy = self._h - sy
+
+        # wrap-around shift by (-sx, -sy) as four rectangular copies (same result as two np.roll passes)
+        out = np.empty_like(base)
+        out[:hy, :wx] = base[sy:, sx:]
+        out[:hy, wx:] = base[sy:, :sx]
+        out[hy:, :wx] = base[:sy, sx:]
+        out[hy:, wx:] = base[:sy, :sx]
+
+        flash_p = vp["flash_p"]
+        if flash_p > 0.0 and self._rng.random() < flash_p:
+            out = _add_sat(out, 10)
 
-        out[:, :, :] = base
-        out = np.roll(out, shift=-sx0, axis=1)
-        out = np.roll(out, shift=-sy0, axis=0)
+        return out
 
-        if vtag == "v3" and self._rng.random() < 0.03:
-            out = np.clip(out.astype(np.int16) + 10, 0, 255).astype(np.uint8)
+    def _get_flat_frame(self, v: int) -> np.ndarray:
+        """Return the cached flat (H, W, 3) frame filled with v for the current size (read-only)."""
+        frame = self._flat_frames.get(v)
+        if frame is None or frame.shape[:2] != (self._h, self._w):
+            frame = np.full((self._h, self._w, 3), v, dtype=np.uint8)
+            frame.setflags(write=False)
+            self._flat_frames[v] = frame
+        return frame
 
-        return out
+    def _get_gradient_frame(self) -> np.ndarray:
+        """Return the cached horizontal 0..255 ramp for the current size (read-only)."""
+        if self._grad_frame is None or self._grad_frame.shape[:2] != (self._h, self._w):
+            row = np.rint(np.linspace(0.0, 255.0, self._w)).astype(np.uint8)
+            self._grad_frame = np.broadcast_to(row[None, :, None], (self._h, self._w, 3)).copy()
+            self._grad_frame.setflags(write=False)
+        return self._grad_frame
 
     def _scene_gradient_shimmer(self, *, dt: float) -> np.ndarray:
         """Scene gradient shimmer."""
-        frame = np.zeros((self._h, self._w, 3), dtype=np.uint8)
-
-        for x in range(self._w):
-            v = int(round(255.0 * float(x) / max(1.0, float(self._w - 1))))
-            frame[:, x, :] = v
+        frame = self._get_gradient_frame()
 
         if self._scene_t >= self._mb_next_update_s:
-            self._mb_next_update_s = self._scene_t + float(self._mb_period_s())
-            rng = random.Random(self._mb_seed + int(self._scene_t * 1000.0) + 29_000)
-            amp = int(self._mb_amp())
-            mb = 16
-            shimmer = np.zeros((self._h, self._w, 3), dtype=np.int16)
-            for by in range(0, self._h, mb):
-                for bx in range(0, self._w, mb):
-                    dv = rng.randint(-amp, amp)
-                    if dv == 0:
-                        continue
-                    shimmer[by : min(self._h, by + mb), bx : min(self._w, bx + mb), :] = dv
-            self._mb_cache = shimmer
+            self._mb_next_update_s = self._scene_t + self._vp["period_s"]
+            rng = np.random.default_rng(int(self._mb_seed) + int(self._scene_t * 1000.0) + 29_000)
+            shimmer = self._block_noise(rng, amp=int(self._vp["amp"]), mb=16)
+            self._mb_cache = np.broadcast_to(shimmer[:, :, None], (self._h, self._w, 3)).copy()
 
         if self._mb_cache is None:
             return frame
 
-        return np.clip(frame.astype(np.int16) + self._mb_cache, 0, 255).astype(np.uint8)
+        return _add_sat(frame, self._mb_cache)
 
     def _scene_scrolling_credits(self, *, dt: float) -> np.ndarray:
         """Scene scrolling credits."""
-        vtag = self._variant_tag(30)
-        frame = np.full((self._h, self._w, 3), 0, dtype=np.uint8)
+        vp = self._vp
+        frame = np.zeros((self._h, self._w, 3), dtype=np.uint8)
 
-        speed = 14.0 if vtag == "v1" else 24.0 if vtag == "v2" else 34.0
-        y = int(round(self._h - (self._scene_t * speed) % (self._h + 220)))
+        y = int(round(self._h - (self._scene_t * vp["speed"]) % (self._h + 220)))
 
-        columns = 2 if vtag != "v3" else 3
+        # 18 two-pixel-high text lines per column, 14 px apart; gather every visible row once
+        ys = y + 14 * np.arange(18)
+        ys = ys[(ys >= 0) & (ys < self._h)]
+        rows = np.concatenate((ys, ys[ys + 1 < self._h] + 1))
+        if rows.size == 0:
+            return frame
+
+        columns = int(vp["columns"])
         col_w = self._w // max(1, columns)
         for c in range(columns):
             x = int(c * col_w + col_w * 0.20)
-            for k in range(18):
-                yy = y + k * 14
-                if 0 <= yy < self._h:
-                    self._rect(frame, x, yy, x + int(col_w * 0.55), yy + 2, 220)
+            x0 = max(0, min(x, self._w - 1))
+            x1 = max(0, min(x + int(col_w * 0.55), self._w))
+            if x1 > x0:
+                frame[rows, x0:x1, :] = 220
 
         return frame
 
     # ---------------- small drawing helpers ----------------
 
+    def _block_noise(self, rng: np.random.Generator, *, amp: int, mb: int) -> np.ndarray:
+        """Return an (H, W) int16 field holding one uniform offset in [-amp, amp] per mb×mb block."""
+        coarse = rng.integers(-amp, amp + 1, size=(-(-self._h // mb), -(-self._w // mb)), dtype=np.int16)
+        return np.repeat(np.repeat(coarse, mb, axis=0), mb, axis=1)[: self._h, : self._w]
+
+    def _apply_blocks(self, img: np.ndarray, bx: np.ndarray, by: np.ndarray, dv: np.ndarray, mb: int) -> None:
+        """Apply saturating per-block offsets dv[k] at (bx[k], by[k]) in place, in order."""
+        for x0, y0, d in zip(bx.tolist(), by.tolist(), dv.tolist()):
+            self._add_block_sat(img, x0, y0, mb, d)
+
+    def _add_block_sat(self, img: np.ndarray, x0: int, y0: int, mb: int, dv: int) -> None:
+        """Saturating in-place add of dv to one mb×mb block, reusing an int16 scratch buffer."""
+        block = img[y0 : min(self._h, y0 + mb), x0 : min(self._w, x0 + mb), :]
+        if self._block_scratch is None or self._block_scratch.shape[0] < mb:
+            self._block_scratch = np.empty((mb, mb, 3), dtype=np.int16)
+        tmp = self._block_scratch[: block.shape[0], : block.shape[1], :]
+        np.add(block, dv, out=tmp, dtype=np.int16)
+        np.clip(tmp, 0, 255, out=tmp)
+        np.copyto(block, tmp, casting="unsafe")
+
     @staticmethod
     def _rect(img: np.ndarray, x0: int, y0: int, x1: int, y1: int, v: int) -> None:
         """Rect."""
-        x0i = max(0, min(int(x0), int(img.shape[1] - 1)))
-        x1i = max(0, min(int(x1), int(img.shape[1])))
-        y0i = max(0, min(int(y0), int(img.shape[0] - 1)))
-        y1i = max(0, min(int(y1), int(img.shape[0])))
+        h, w = img.shape[0], img.shape[1]
+        x0i, x1i, y0i, y1i, vi = int(x0), int(x1), int(y0), int(y1), int(v)
+        # inline ternary clamps: this is called in loops, and min/max builtins cost two calls each
+        x0i = 0 if x0i < 0 else w - 1 if x0i > w - 1 else x0i
+        x1i = 0 if x1i < 0 else w if x1i > w else x1i
+        y0i = 0 if y0i < 0 else h - 1 if y0i > h - 1 else y0i
+        y1i = 0 if y1i < 0 else h if y1i > h else y1i
         if x1i <= x0i or y1i <= y0i:
             return
-        img[y0i:y1i, x0i:x1i, :] = int(max(0, min(255, int(v))))
+        img[y0i:y1i, x0i:x1i, :] = 0 if vi < 0 else 255 if vi > 255 else vi
 
     @staticmethod
     def _dot(img: np.ndarray, x: int, y: int, r: int, v: int) -> None:
@@ -1242,13 +1348,11 @@ class TestDataEngine:
         rr = max(1, int(r))
         xi = int(x)
         yi = int(y)
-        for dy in range(-rr, rr + 1):
-            yy = yi + dy
-            if yy < 0 or yy >= img.shape[0]:
-                continue
-            for dx in range(-rr, rr + 1):
-                xx = xi + dx
-                if xx < 0 or xx >= img.shape[1]:
-                    continue
-                if (dx * dx + dy * dy) <= (rr * rr):
-                    img[yy, xx, :] = int(max(0, min(255, int(v))))
+        y0 = max(0, yi - rr)
+        y1 = min(int(img.shape[0]), yi + rr + 1)
+        x0 = max(0, xi - rr)
+        x1 = min(int(img.shape[1]), xi + rr + 1)
+        if y1 <= y0 or x1 <= x0:
+            return
+        mask = _disk_mask(rr)[y0 - yi + rr : y1 - yi + rr, x0 - xi + rr : x1 - xi + rr]
+        img[y0:y1, x0:x1][mask] = int(max(0, min(255, int(v))))
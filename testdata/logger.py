@@ -9,6 +9,19 @@ from typing import Optional
 import csv
 
 
+# Mismatch rows are buffered and flushed in batches; close() always flushes the remainder.
+_FLUSH_EVERY_ROWS = 128
+
+# One pre-baked line per row; matches csv.writer's default dialect (comma separated, CRLF).
+_ROW_TEMPLATE = "{},{},{},{:.3f},{},{:.6g},{},{},{},{},{:.6g},{:.6g},{:.6g},{:.6g},{:.6g},{:.6g}\r\n"
+
+
+def _csv_text(s: str) -> str:
+    """Quote a free-text field the way csv.writer would (only when it contains a delimiter, quote or newline)."""
+    if "," in s or '"' in s or "\n" in s or "\r" in s:
+        return '"' + s.replace('"', '""') + '"'
+    return s
+
 
 @dataclass(frozen=True)
 class TestDataLogRow:
@@ -47,9 +60,9 @@ class TestDataLogger:
         stamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
         self._path = d / f"testdata_{stamp}.csv"
         self._fh = self._path.open("w", newline="", encoding="utf-8")
-        self._w = csv.writer(self._fh)
+        self._rows_since_flush = 0
 
-        self._w.writerow(
+        csv.writer(self._fh).writerow(
             [
                 "ts_iso",
                 "scene_index",
@@ -79,27 +92,30 @@ class TestDataLogger:
     def write(self, row: TestDataLogRow) -> None:
         """Write one record to the output destination used by this component."""
         if(row.actual_state != row.expected_state):
-            self._w.writerow(
-                [
+            self._fh.write(
+                _ROW_TEMPLATE.format(
                     row.ts_iso,
                     row.scene_index,
-                    row.scene_name,
-                    f"{row.scene_time_s:.3f}",
-                    row.expected_state,
-                    f"{row.output_value:.6g}",
+                    _csv_text(row.scene_name),
+                    row.scene_time_s,
+                    _csv_text(row.expected_state),
+                    row.output_value,
                     "" if row.detection_value is None else f"{row.detection_value:.6g}",
                     "" if row.confidence is None else f"{row.confidence:.6g}",
-                    "" if row.actual_state is None else row.actual_state,
+                    "" if row.actual_state is None else _csv_text(row.actual_state),
                     "" if row.match is None else ("1" if row.match else "0"),
-                    f"{row.diff_gain:.6g}",
-                    f"{row.ema_alpha:.6g}",
-                    f"{row.no_motion_threshold:.6g}",
-                    f"{row.low_activity_threshold:.6g}",
-                    f"{row.mean_full_scale:.6g}",
-                    f"{row.fps:.6g}",
-                ]
+                    row.diff_gain,
+                    row.ema_alpha,
+                    row.no_motion_threshold,
+                    row.low_activity_threshold,
+                    row.mean_full_scale,
+                    row.fps,
+                )
             )
-            self._fh.flush()
+            self._rows_since_flush += 1
+            if self._rows_since_flush >= _FLUSH_EVERY_ROWS:
+                self._rows_since_flush = 0
+                self._fh.flush()
 
     def close(self) -> None:
         """Close open resources so files/handles are safely released."""
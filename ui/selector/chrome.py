@@ -2,14 +2,28 @@
 
 from __future__ import annotations
 
+from contextlib import contextmanager
 from dataclasses import dataclass
+from typing import Iterator
 
-from PySide6.QtCore import QPoint, QRect, Qt
-from PySide6.QtGui import QColor, QPainter, QPen
+from PySide6.QtCore import QLine, QPoint, QRect, Qt
+from PySide6.QtGui import QBrush, QColor, QPainter, QPen
 
 from ui.selector.models import clamp_int
 
 
+@contextmanager
+def _pen_brush_guard(p: QPainter) -> Iterator[QPainter]:
+    """Snapshot only pen + brush and restore them on exit (cheaper than save()/restore())."""
+    old_pen = p.pen()
+    old_brush = p.brush()
+    try:
+        yield p
+    finally:
+        p.setPen(old_pen)
+        p.setBrush(old_brush)
+
+
 @dataclass(frozen=True)
 class ChromeConfig:
     """
@@ -46,6 +60,29 @@ class ChromeUi:
         self._cfg = cfg
         self._close_hover = False
 
+        # Config is frozen, so the derived sizes are computed once here.
+        self._bar_h = int(cfg.chrome_bar_h_px)
+        self._gap = int(cfg.chrome_gap_px)
+        self._pref = int(cfg.chrome_btn_pref_px)
+        self._max_s = max(14, self._bar_h - 2 * self._gap)
+        self._btn_s = min(self._pref, self._max_s)
+
+        # Close button rect memoized per layout key: (widget_w, inner_top, rect).
+        self._cached_close_rect: tuple[int, int, QRect] | None = None
+
+        # Close button radius and "X" strokes, derived from the memoized rect (identity-keyed).
+        self._cached_close_shape: tuple[QRect, int, list[QLine]] | None = None
+
+        # Scratch rect for the bar, updated in place each paint instead of allocating a QRect.
+        self._bar_rect = QRect()
+
+        # Paint resources reused across frames (the overlay repaints at pointer rate while dragging).
+        self._bar_brush = QBrush(QColor(0, 0, 0, 70))
+        self._pill_brush_normal = QBrush(QColor(220, 30, 30, 200))
+        self._pill_brush_hover = QBrush(QColor(220, 30, 30, 240))
+        self._x_pen = QPen(QColor(255, 255, 255, 245))
+        self._x_pen.setWidth(2)
+
     @property
     def close_hover(self) -> bool:
         """
@@ -62,8 +99,7 @@ class ChromeUi:
         - Enforce a minimum size so the button remains usable on small bars.
         - Prefer `chrome_btn_pref_px` but clamp down if it would not fit.
         """
-        max_s = max(14, int(self._cfg.chrome_bar_h_px) - 2 * int(self._cfg.chrome_gap_px))
-        return int(min(int(self._cfg.chrome_btn_pref_px), max_s))
+        return self._btn_s
 
     def chrome_y(self, *, inner_top: int, s: int) -> int:
         """
@@ -74,8 +110,8 @@ class ChromeUi:
         - The chrome bar occupies [inner_top - chrome_bar_h_px, inner_top).
         - Returned y is vertically centered within that bar.
         """
-        bar_top = int(inner_top) - int(self._cfg.chrome_bar_h_px)
-        return int(bar_top + max(0, (int(self._cfg.chrome_bar_h_px) - int(s)) // 2))
+        bar_top = int(inner_top) - self._bar_h
+        return bar_top + max(0, (self._bar_h - int(s)) // 2)
 
     def close_rect(self, *, widget_w: int, inner_top: int) -> QRect:
         """
@@ -86,11 +122,22 @@ class ChromeUi:
         - `chrome_gap_px` padding from the right edge.
         - Vertically centered in the chrome bar.
         """
-        s = self.btn_size_px()
-        g = int(self._cfg.chrome_gap_px)
-        x = int(widget_w) - s - g
+        c = self._cached_close_rect
+        if c is not None and c[0] == widget_w and c[1] == inner_top:
+            return c[2]
+        s = self._btn_s
+        x = int(widget_w) - s - self._gap
         y = self.chrome_y(inner_top=inner_top, s=s)
-        return QRect(x, y, s, s)
+        r = QRect(x, y, s, s)
+        self._cached_close_rect = (widget_w, inner_top, r)
+        return r
+
+    def _hit_close(self, x: int, y: int, widget_w: int, inner_top: int) -> bool:
+        """Integer-only close button containment test (same bounds as close_rect().contains())."""
+        r = self.close_rect(widget_w=widget_w, inner_top=inner_top)
+        x0 = r.x()
+        y0 = r.y()
+        return x0 <= x < x0 + r.width() and y0 <= y < y0 + r.height()
 
     def update_hover(self, *, widget_w: int, inner_top: int, pos: QPoint) -> bool:
         """
@@ -102,7 +149,12 @@ class ChromeUi:
         This method is used to avoid repainting on every mouse-move when hover state
         has not actually changed.
         """
-        new_hover = self.close_rect(widget_w=widget_w, inner_top=inner_top).contains(pos)
+        # The close button lives in the chrome bar above inner_top; pointers over the
+        # grid (the common case) cannot hover it, so skip the rect lookup entirely.
+        if pos.y() >= inner_top:
+            new_hover = False
+        else:
+            new_hover = self._hit_close(pos.x(), pos.y(), widget_w, inner_top)
         if new_hover == self._close_hover:
             return False
         self._close_hover = new_hover
@@ -118,13 +170,14 @@ class ChromeUi:
 
         Note:
         - Caller controls overall widget transparency and composition; we just paint shapes.
+        - Pen and brush are restored on exit (the only painter state touched).
         """
-        bar = QRect(0, 0, int(widget_w), int(inner_top))
-        p.save()
-        p.setPen(Qt.PenStyle.NoPen)
-        p.setBrush(QColor(0, 0, 0, 70))
-        p.drawRect(bar)
-        p.restore()
+        bar = self._bar_rect
+        bar.setRect(0, 0, int(widget_w), int(inner_top))
+        with _pen_brush_guard(p):
+            p.setPen(Qt.PenStyle.NoPen)
+            p.setBrush(self._bar_brush)
+            p.drawRect(bar)
 
     def draw_close_button(self, p: QPainter, *, widget_w: int, inner_top: int) -> None:
         """
@@ -136,35 +189,28 @@ class ChromeUi:
         Geometry:
         - Corner radius scales with button size but is clamped to avoid extremes.
         - X padding scales with button size but is clamped to keep strokes inside bounds.
+        - Radius and strokes are rebuilt only when the close rect changes.
         """
         close_r = self.close_rect(widget_w=widget_w, inner_top=inner_top)
-        s = max(1, close_r.width())
-        radius = clamp_int(int(round(s * 0.18)), 3, 8)
-
-        p.save()
-
-        # Background pill.
-        p.setPen(Qt.PenStyle.NoPen)
-        p.setBrush(QColor(220, 30, 30, 240 if self._close_hover else 200))
-        p.drawRoundedRect(close_r, radius, radius)
-
-        # White "X" strokes.
-        x_pen = QPen(QColor(255, 255, 255, 245))
-        x_pen.setWidth(2)
-        p.setPen(x_pen)
-
-        pad = clamp_int(int(round(close_r.width() * 0.28)), 7, 12)
-        p.drawLine(
-            close_r.left() + pad,
-            close_r.top() + pad,
-            close_r.right() - pad,
-            close_r.bottom() - pad,
-        )
-        p.drawLine(
-            close_r.right() - pad,
-            close_r.top() + pad,
-            close_r.left() + pad,
-            close_r.bottom() - pad,
-        )
-
-        p.restore()
+        shape = self._cached_close_shape
+        if shape is None or shape[0] is not close_r:
+            s = max(1, close_r.width())
+            radius = clamp_int(int(round(s * 0.18)), 3, 8)
+            pad = clamp_int(int(round(close_r.width() * 0.28)), 7, 12)
+            l = close_r.left() + pad
+            t = close_r.top() + pad
+            r = close_r.right() - pad
+            b = close_r.bottom() - pad
+            shape = (close_r, radius, [QLine(l, t, r, b), QLine(r, t, l, b)])
+            self._cached_close_shape = shape
+        _, radius, x_lines = shape
+
+        with _pen_brush_guard(p):
+            # Background pill.
+            p.setPen(Qt.PenStyle.NoPen)
+            p.setBrush(self._pill_brush_hover if self._close_hover else self._pill_brush_normal)
+            p.drawRoundedRect(close_r, radius, radius)
+
+            # White "X" strokes, both in one drawLines call.
+            p.setPen(self._x_pen)
+            p.drawLines(x_lines)
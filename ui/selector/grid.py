@@ -2,13 +2,46 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
+import numpy as np
 from PySide6.QtCore import QPoint, QRect
-from PySide6.QtGui import QFont, QFontMetrics
+from PySide6.QtGui import QFont, QFontMetrics, QPainterPath
 
-from ui.selector.models import clamp_int
+
+@lru_cache(maxsize=1)
+def base_font() -> QFont:
+    """
+    Application default font, looked up once.
+
+    Built lazily rather than at import time: QFont() needs a QGuiApplication to resolve
+    the platform default. Derived fonts copy it instead of repeating the lookup.
+    """
+    return QFont()
+
+
+@lru_cache(maxsize=64)
+def label_font(px: int) -> QFont:
+    """Bold tile label font for a pixel size (shared; callers must not mutate it)."""
+    f = QFont(base_font())
+    f.setPixelSize(px)
+    f.setBold(True)
+    return f
+
+
+@lru_cache(maxsize=64)
+def label_metrics(px: int) -> QFontMetrics:
+    """Font metrics for `label_font(px)`."""
+    return QFontMetrics(label_font(px))
+
+
+@lru_cache(maxsize=256)
+def label_advance(px: int, label: str) -> int:
+    """Horizontal advance of `label` in the tile label font of size `px`."""
+    return label_metrics(px).horizontalAdvance(label)
 
 
 @dataclass(frozen=True)
@@ -58,12 +91,13 @@ class GridGeometry:
         return r
 
     @staticmethod
-    def edges(size: int, parts: int) -> list[int]:
+    @lru_cache(maxsize=64)
+    def edges(size: int, parts: int) -> tuple[int, ...]:
         """
         Compute `parts` partitions of a 1D span and return the edge coordinates.
 
         Returns:
-            List[int] of length parts+1 with:
+            Tuple[int, ...] of length parts+1 with:
               - out[0] == 0
               - out[parts] == size
               - intermediate edges proportional to i/parts (rounded)
@@ -74,13 +108,18 @@ class GridGeometry:
             - This does not enforce strict monotonicity under all rounding scenarios,
               but for typical UI sizes it is sufficient. If needed, add a fix-up pass
               to ensure out[i] >= out[i-1].
+            - The rounding is vectorized (np.rint rounds half-to-even like round()), and
+              the result is converted back to a tuple of ints so it stays hashable for
+              line_path's cache and usable with bisect.
+            - Results are memoized per (size, parts); the widget size rarely changes
+              between pointer events, so hover/hit-tests reuse the same tuple.
         """
-        out = [int(round(i * size / parts)) for i in range(parts + 1)]
+        out = np.rint(np.arange(parts + 1) * size / parts).astype(np.int64)
         out[0] = 0
         out[parts] = int(size)
-        return out
+        return tuple(out.tolist())
 
-    def tile_rects(self, *, widget_rect: QRect) -> tuple[QRect, list[int], list[int]]:
+    def tile_rects(self, *, widget_rect: QRect) -> tuple[QRect, tuple[int, ...], tuple[int, ...]]:
         """
         Compute the grid edge arrays for the current widget size.
 
@@ -110,41 +149,80 @@ class GridGeometry:
 
         Implementation details:
             - Convert position to coordinates relative to inner_rect.
-            - Find the first edge interval that contains the point.
-            - Fallback to the last row/col if rounding creates a boundary case.
+            - Map each axis to its row/col via span_index (integer division for
+              evenly divisible spans, else bisect over the cached edges).
         """
-        inner, x_edges, y_edges = self.tile_rects(widget_rect=widget_rect)
+        inner = self.inner_rect(widget_rect)
         if not inner.contains(pos):
             return None
 
-        rel_x = pos.x() - inner.left()
-        rel_y = pos.y() - inner.top()
-
         cols = int(self.grid_cols)
         rows = int(self.grid_rows)
 
-        col = next((c for c in range(cols) if x_edges[c] <= rel_x < x_edges[c + 1]), cols - 1)
-        row = next((r for r in range(rows) if y_edges[r] <= rel_y < y_edges[r + 1]), rows - 1)
+        col = self.span_index(pos.x() - inner.left(), inner.width(), cols)
+        row = self.span_index(pos.y() - inner.top(), inner.height(), rows)
 
         return row * cols + col
 
     @staticmethod
-    def _tile_font(*, tile_h: int) -> QFont:
-        """Match selector painter font sizing for tile number labels."""
-        px = clamp_int(int(round(tile_h * 0.24)), 10, 32)
-        f = QFont()
-        f.setPixelSize(px)
-        f.setBold(True)
-        return f
+    def span_index(rel: int, size: int, parts: int) -> int:
+        """
+        Return which of `parts` partitions of a 1D span of `size` contains offset `rel`.
+
+        When `size` divides evenly, every edge is exactly i*size/parts, so a single
+        integer division gives the answer without touching the edge array. Otherwise
+        binary-search the (monotonic) edges. Either way the result is clamped to the
+        valid range in case rounding creates a boundary case.
+        """
+        if size % parts == 0:
+            i = rel * parts // size
+        else:
+            i = bisect_right(GridGeometry.edges(size, parts), rel) - 1
+        return min(parts - 1, max(0, i))
+
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def line_path(
+        left: int,
+        top: int,
+        right: int,
+        bottom: int,
+        x_edges: tuple[int, ...],
+        y_edges: tuple[int, ...],
+    ) -> QPainterPath:
+        """
+        Build one path holding every internal grid line (vertical then horizontal).
+
+        Args are the inner rect bounds (inclusive, as QRect reports them) and the edge
+        tuples from tile_rects. The result is memoized, so repeated paints at the same
+        size reuse a single path and draw the grid with one drawPath call.
+        Callers must not mutate the returned path.
+        """
+        path = QPainterPath()
+        for x in [left + xe for xe in x_edges[1:-1]]:
+            path.moveTo(x, top)
+            path.lineTo(x, bottom)
+        for y in [top + ye for ye in y_edges[1:-1]]:
+            path.moveTo(left, y)
+            path.lineTo(right, y)
+        return path
+
+    @staticmethod
+    def label_font_px(tile_h: int) -> int:
+        """Tile label font pixel size: ~24% of tile height (rounded), clamped to [10, 32]."""
+        return min(32, max(10, (tile_h * 24 + 50) // 100))
+
+    @staticmethod
+    def label_pad(tile_w: int, tile_h: int) -> int:
+        """Tile label badge padding: ~6% of the smaller tile side (rounded), clamped to [4, 10]."""
+        return min(10, max(4, (min(tile_w, tile_h) * 6 + 50) // 100))
 
     @staticmethod
-    def _tile_label_badge_rect(*, tile: QRect, label: str, tile_h: int) -> QRect:
+    def _tile_label_badge_rect(*, tile: QRect, label: str, font_px: int, pad: int) -> QRect:
         """Match selector painter label-badge geometry for hit testing."""
-        fm = QFontMetrics(GridGeometry._tile_font(tile_h=tile_h))
-        tw = fm.horizontalAdvance(label)
-        th = fm.height()
+        tw = label_advance(font_px, label)
+        th = label_metrics(font_px).height()
 
-        pad = clamp_int(int(round(min(tile.width(), tile.height()) * 0.06)), 4, 10)
         bw = min(tile.width(), tw + 2 * pad)
         bh = min(tile.height(), th + 2 * pad)
 
@@ -157,27 +235,52 @@ class GridGeometry:
         Return tile index only when `pos` hits the rendered tile-number badge.
 
         This deliberately excludes clicks on empty tile area, grid lines, and borders.
+
+        Tiles do not overlap, so only the tile under `pos` can own the hit badge;
+        locate it by bisecting the edges and measure just that one badge.
+        Edges are only built once `pos` is known to be inside the inner rect.
         """
-        inner, x_edges, y_edges = self.tile_rects(widget_rect=widget_rect)
+        inner = self.inner_rect(widget_rect)
         if not inner.contains(pos):
             return None
 
+        x_edges = self.edges(inner.width(), int(self.grid_cols))
+        y_edges = self.edges(inner.height(), int(self.grid_rows))
+        return self.tile_label_index_in(inner=inner, x_edges=x_edges, y_edges=y_edges, pos=pos)
+
+    def tile_label_index_in(
+        self,
+        *,
+        inner: QRect,
+        x_edges: tuple[int, ...],
+        y_edges: tuple[int, ...],
+        pos: QPoint,
+    ) -> Optional[int]:
+        """
+        Badge hit-test against precomputed tile_rects output (for callers that cache it).
+
+        `pos` must already be known to lie inside `inner`.
+        """
         left = inner.left()
         top = inner.top()
         cols = int(self.grid_cols)
         rows = int(self.grid_rows)
         tile_h = max(1, inner.height() // rows)
-
-        for row in range(rows):
-            y0 = top + y_edges[row]
-            y1 = top + y_edges[row + 1]
-            for col in range(cols):
-                x0 = left + x_edges[col]
-                x1 = left + x_edges[col + 1]
-                tile = QRect(x0, y0, max(1, x1 - x0), max(1, y1 - y0)).adjusted(0, 0, -1, -1)
-                idx = row * cols + col
-                label_rect = self._tile_label_badge_rect(tile=tile, label=str(idx + 1), tile_h=tile_h)
-                if label_rect.contains(pos):
-                    return idx
+        pad = self.label_pad(max(1, inner.width() // cols), tile_h)
+
+        col = min(cols - 1, max(0, bisect_right(x_edges, pos.x() - left) - 1))
+        row = min(rows - 1, max(0, bisect_right(y_edges, pos.y() - top) - 1))
+
+        x0 = left + x_edges[col]
+        x1 = left + x_edges[col + 1]
+        y0 = top + y_edges[row]
+        y1 = top + y_edges[row + 1]
+        tile = QRect(x0, y0, max(1, x1 - x0) - 1, max(1, y1 - y0) - 1)
+        idx = row * cols + col
+        label_rect = self._tile_label_badge_rect(
+            tile=tile, label=str(idx + 1), font_px=self.label_font_px(tile_h), pad=pad
+        )
+        if label_rect.contains(pos):
+            return idx
 
         return None
@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Callable
 
-from PySide6.QtCore import QPoint, QRect, Qt
+from PySide6.QtCore import QPoint, QRect, Qt, QTimer
 from PySide6.QtWidgets import QWidget
 
 from ui.selector.chrome import ChromeUi
@@ -15,6 +15,41 @@ from ui.tiles_sync import TilesSync
 from ui.selector.models import ResizeMode
 
 
+# Resize-handle bitfield: one bit per dragged edge; 0 means "move" (no edge).
+L, R, T, B = 1, 2, 4, 8
+MOVE = 0
+
+# Raw edge hits (bit0 left, bit1 right, bit2 top, bit3 bottom) -> resize bits, with left winning
+# over right and top over bottom, so hit-testing is one table index instead of branches.
+_NORM_BITS: tuple[int, ...] = tuple(
+    (L if raw & L else raw & R) | (T if raw & T else raw & B) for raw in range(16)
+)
+
+_MODE_FOR_BITS: dict[int, ResizeMode] = {
+    MOVE: "move",
+    L: "l",
+    R: "r",
+    T: "t",
+    B: "b",
+    T | L: "tl",
+    T | R: "tr",
+    B | L: "bl",
+    B | R: "br",
+}
+
+_CURSOR_FOR_BITS: dict[int, Qt.CursorShape] = {
+    MOVE: Qt.CursorShape.SizeAllCursor,
+    L: Qt.CursorShape.SizeHorCursor,
+    R: Qt.CursorShape.SizeHorCursor,
+    T: Qt.CursorShape.SizeVerCursor,
+    B: Qt.CursorShape.SizeVerCursor,
+    T | L: Qt.CursorShape.SizeFDiagCursor,
+    B | R: Qt.CursorShape.SizeFDiagCursor,
+    T | R: Qt.CursorShape.SizeBDiagCursor,
+    B | L: Qt.CursorShape.SizeBDiagCursor,
+}
+
+
 @dataclass(frozen=True)
 class InteractionConfig:
     """
@@ -44,7 +79,7 @@ class SelectorInteractor:
 
     Design note:
     - Uses global mouse deltas (global_pos - drag_start_pos) so moving is stable regardless of widget-local coords.
-    - Emits region updates during drag for real-time feedback, and once again on release to finalize.
+    - Emits region updates during drag for real-time feedback (coalesced to ~60 Hz), and once again on release to finalize.
     """
 
     def __init__(
@@ -79,8 +114,11 @@ class SelectorInteractor:
         # Callback invoked when close is requested.
         self._on_close = on_close
 
-        # Interaction config (hit-test margin, min size).
+        # Interaction config (hit-test margin, min size); ints cached for the per-event paths.
         self._cfg = cfg
+        self._margin = int(cfg.margin_px)
+        self._min_w = int(cfg.min_w)
+        self._min_h = int(cfg.min_h)
 
         # Callback used to gate tile toggling by tile-label visibility state.
         self._are_tile_labels_enabled = are_tile_labels_enabled
@@ -91,12 +129,60 @@ class SelectorInteractor:
         # - edge/corner codes (l/r/t/b/tl/tr/bl/br) mean resizing.
         self._drag_mode: ResizeMode = "none"
 
+        # Edge bits (L/R/T/B) of the active drag; tested on every drag move instead of substring checks.
+        self._drag_bits = MOVE
+
+        # Last cursor shape installed on the widget; setCursor is skipped when unchanged.
+        self._last_cursor: Qt.CursorShape | None = None
+
         # Global cursor position at drag start (screen coordinates).
         self._drag_start_pos = QPoint(0, 0)
 
         # Widget geometry at drag start (screen coordinates).
         self._start_geom = QRect()
 
+        # Inner rect memoized per widget size: (w, h, inner).
+        # Pointer events arrive far more often than resizes, so most lookups hit this cache.
+        self._cached_inner: tuple[int, int, QRect] | None = None
+
+        # Tile layout memoized per (w, h, rows, cols): (key, inner, x_edges, y_edges).
+        # Grid size is part of the key because UI settings can change it at runtime.
+        self._geom_cache: tuple[tuple[int, int, int, int], QRect, tuple[int, ...], tuple[int, ...]] | None = None
+
+        # Drag geometry is buffered and applied at most once per ~16 ms: setGeometry on a
+        # top-level window is a native round-trip, so per-pointer-event calls cause jank.
+        self._pending_geom: QRect | None = None
+        self._geom_timer = QTimer(widget)
+        self._geom_timer.setSingleShot(True)
+        self._geom_timer.setInterval(16)
+        self._geom_timer.timeout.connect(self._apply_pending_geom)  # type: ignore[arg-type]
+
+    def _inner(self) -> QRect:
+        """Return the grid inner rect for the current widget size, rebuilding only on size change."""
+        w = self._w.width()
+        h = self._w.height()
+        c = self._cached_inner
+        if c is not None and c[0] == w and c[1] == h:
+            return c[2]
+        inner = self._grid.inner_rect(self._w.rect())
+        self._cached_inner = (w, h, inner)
+        return inner
+
+    def tile_layout(self) -> tuple[QRect, tuple[int, ...], tuple[int, ...]]:
+        """
+        Return (inner, x_edges, y_edges) for the current widget/grid size, rebuilding only on change.
+
+        Shared by hit-testing and paintEvent, so repaints at an unchanged size (hover, state,
+        move-only drags) reuse the same layout instead of recomputing the inner rect and edges.
+        """
+        key = (self._w.width(), self._w.height(), int(self._grid.grid_rows), int(self._grid.grid_cols))
+        c = self._geom_cache
+        if c is not None and c[0] == key:
+            return c[1], c[2], c[3]
+        inner, x_edges, y_edges = self._grid.tile_rects(widget_rect=self._w.rect())
+        self._geom_cache = (key, inner, x_edges, y_edges)
+        return inner, x_edges, y_edges
+
     def update_hover(self, pos: QPoint) -> bool:
         """
         Update chrome hover state (notably the close button) for the given local widget position.
@@ -104,64 +190,58 @@ class SelectorInteractor:
         Returns:
             bool: whether hover state changed (delegated to ChromeUi).
         """
-        inner_top = self._grid.inner_rect(self._w.rect()).top()
+        inner_top = self._inner().top()
         return self._chrome.update_hover(widget_w=self._w.width(), inner_top=inner_top, pos=pos)
 
-    def hit_test(self, pos: QPoint) -> ResizeMode:
+    def close_button_rect(self) -> QRect:
         """
-        Determine what interaction mode a local pointer position implies.
+        Widget-local area repainted when the close button hover state changes.
 
-        Priority:
-        1) Close button region: treated as "move" here (cursor/press logic special-cases it).
-        2) Above inner rect (chrome/title bar): "move"
-        3) Near edges/corners within margin_px: resize mode
-        4) Everywhere else inside inner area: "move" (used for tile toggles or move fallback)
+        The button rect grown by one pixel so antialiased pill edges are included.
         """
-        inner_top = self._grid.inner_rect(self._w.rect()).top()
+        inner_top = self._inner().top()
+        return self._chrome.close_rect(widget_w=self._w.width(), inner_top=inner_top).adjusted(-1, -1, 1, 1)
+
+    def _hit_bits(self, pos: QPoint) -> int:
+        """
+        Edge bits (L/R/T/B) for a local pointer position; MOVE (0) when no resize handle is hit.
+
+        Left wins over right and top over bottom, so a hit always maps to one of the
+        eight resize modes (corners are simply two bits set). The four edge comparisons are
+        packed into a 4-bit index and normalized through _NORM_BITS.
+        """
+        inner_top = self._inner().top()
 
         # Special-case: if hovering the close button, we don't want resize cursors.
-        # We return "move" so set_cursor_for can decide pointing-hand via chrome.close_hover.
+        # We return MOVE so set_cursor_for can decide pointing-hand via chrome.close_hover.
         if self._chrome.close_rect(widget_w=self._w.width(), inner_top=inner_top).contains(pos):
-            return "move"
+            return MOVE
+
+        return self._edge_bits(pos)
 
-        # Edge/corner hit-testing in widget-local coordinates.
-        m = int(self._cfg.margin_px)
+    def _edge_bits(self, pos: QPoint) -> int:
+        """Edge/corner hit-test in widget-local coordinates, without the close button check."""
+        m = self._margin
         x = pos.x()
         y = pos.y()
-        w = self._w.width()
-        h = self._w.height()
 
-        left = x <= m
-        right = x >= w - m
-        top = y <= m
-        bottom = y >= h - m
-
-        # Corners first (more specific).
-        if top and left:
-            return "tl"
-        if top and right:
-            return "tr"
-        if bottom and left:
-            return "bl"
-        if bottom and right:
-            return "br"
-
-        # Then edges.
-        if left:
-            return "l"
-        if right:
-            return "r"
-        if top:
-            return "t"
-        if bottom:
-            return "b"
-
-        # Top chrome area (above the grid/inner rect) but away from edge handles moves the window.
-        if pos.y() < inner_top:
-            return "move"
-
-        # Inside: default behavior is "move" (but press logic may interpret as tile toggle).
-        return "move"
+        return _NORM_BITS[
+            (x <= m)
+            | ((x >= self._w.width() - m) << 1)
+            | ((y <= m) << 2)
+            | ((y >= self._w.height() - m) << 3)
+        ]
+
+    def hit_test(self, pos: QPoint) -> ResizeMode:
+        """
+        Determine what interaction mode a local pointer position implies.
+
+        Priority:
+        1) Close button region: treated as "move" here (cursor/press logic special-cases it).
+        2) Near edges/corners within margin_px: resize mode (corners before edges)
+        3) Everywhere else (chrome bar or inner area): "move" (used for tile toggles or move fallback)
+        """
+        return _MODE_FOR_BITS[self._hit_bits(pos)]
 
     def set_cursor_for(self, *, pos: QPoint) -> None:
         """
@@ -173,34 +253,30 @@ class SelectorInteractor:
         - If pointer is in chrome/title area -> move cursor.
         - Else -> resize cursor for edges/corners, otherwise move cursor.
         """
-        inner_top = self._grid.inner_rect(self._w.rect()).top()
-        mode = self.hit_test(pos)
-
         # Do not override cursor while dragging; mouse move should not fight drag mode.
         if self._drag_mode != "none":
             return
 
         # Chrome can decide hover, we map that to a pointing-hand cursor.
         if self._chrome.close_hover:
-            self._w.setCursor(Qt.CursorShape.PointingHandCursor)
+            self._set_cursor(Qt.CursorShape.PointingHandCursor)
             return
 
         # Above inner rect is "move window".
-        if pos.y() < inner_top:
-            self._w.setCursor(Qt.CursorShape.SizeAllCursor)
+        if pos.y() < self._inner().top():
+            self._set_cursor(Qt.CursorShape.SizeAllCursor)
             return
 
-        # Resize cursors depend on which edge/corner we're on.
-        if mode in ("l", "r"):
-            self._w.setCursor(Qt.CursorShape.SizeHorCursor)
-        elif mode in ("t", "b"):
-            self._w.setCursor(Qt.CursorShape.SizeVerCursor)
-        elif mode in ("tl", "br"):
-            self._w.setCursor(Qt.CursorShape.SizeFDiagCursor)
-        elif mode in ("tr", "bl"):
-            self._w.setCursor(Qt.CursorShape.SizeBDiagCursor)
-        else:
-            self._w.setCursor(Qt.CursorShape.SizeAllCursor)
+        # Resize cursors depend on which edge/corner we're on. The close button lives above
+        # inner_top, so its hit-test is skipped here.
+        self._set_cursor(_CURSOR_FOR_BITS[self._edge_bits(pos)])
+
+    def _set_cursor(self, shape: Qt.CursorShape) -> None:
+        """Apply a cursor shape only when it differs from the one last installed."""
+        if shape == self._last_cursor:
+            return
+        self._last_cursor = shape
+        self._w.setCursor(shape)
 
     def on_mouse_press(self, *, button: Qt.MouseButton, pos: QPoint, global_pos: QPoint) -> bool:
         """
@@ -220,7 +296,7 @@ class SelectorInteractor:
         if button != Qt.MouseButton.LeftButton:
             return False
 
-        inner = self._grid.inner_rect(self._w.rect())
+        inner = self._inner()
         close_r = self._chrome.close_rect(widget_w=self._w.width(), inner_top=inner.top())
 
         # Close button wins; no drag should start.
@@ -231,22 +307,29 @@ class SelectorInteractor:
         # Chrome/title bar drag: move window.
         if pos.y() < inner.top():
             self._drag_mode = "move"
+            self._drag_bits = MOVE
             self._drag_start_pos = global_pos
             self._start_geom = self._w.geometry()
             return True
 
-        mode = self.hit_test(pos)
+        bits = self._hit_bits(pos)
 
         # Clicking inside the grid area with "move" means "toggle tile" if over a tile.
         # This intentionally prevents starting a move drag from inside the grid; the grid is interactive.
-        if mode == "move" and self._are_tile_labels_enabled():
-            idx = self._grid.tile_label_index_at(widget_rect=self._w.rect(), pos=pos)
+        if bits == MOVE and self._are_tile_labels_enabled():
+            inner, x_edges, y_edges = self.tile_layout()
+            idx = (
+                self._grid.tile_label_index_in(inner=inner, x_edges=x_edges, y_edges=y_edges, pos=pos)
+                if inner.contains(pos)
+                else None
+            )
             if idx is not None:
                 self._tiles.toggle(idx)
                 return True
 
         # Otherwise start a drag (move/resize depending on mode).
-        self._drag_mode = mode
+        self._drag_mode = _MODE_FOR_BITS[bits]
+        self._drag_bits = bits
         self._drag_start_pos = global_pos
         self._start_geom = self._w.geometry()
         return True
@@ -256,12 +339,13 @@ class SelectorInteractor:
         Handle mouse move during an active drag.
 
         Returns:
-            bool: True if dragging was in progress and we updated geometry.
+            bool: True if dragging was in progress and we queued a geometry update.
 
         Implementation details:
         - We clone the start geometry and apply delta from the original global press position.
         - Resize adjusts the corresponding edges; then we clamp to minimum size.
-        - After applying geometry, emit region updates with reason="drag" for live monitoring.
+        - The new geometry is buffered and applied by a ~60 Hz timer, which then schedules a
+          coalesced region update with reason="drag" for live monitoring.
         """
         if self._drag_mode == "none":
             return False
@@ -269,10 +353,11 @@ class SelectorInteractor:
         delta = global_pos - self._drag_start_pos
         g = QRect(self._start_geom)
 
-        min_w = int(self._cfg.min_w)
-        min_h = int(self._cfg.min_h)
+        min_w = self._min_w
+        min_h = self._min_h
 
-        if self._drag_mode == "move":
+        bits = self._drag_bits
+        if bits == MOVE:
             # Move uses the start top-left plus global delta.
             g.moveTo(self._start_geom.topLeft() + delta)
         else:
@@ -280,34 +365,47 @@ class SelectorInteractor:
             dy = delta.y()
 
             # Resizing: mutate only the edges implied by drag mode.
-            if "l" in self._drag_mode:
+            if bits & L:
                 g.setLeft(g.left() + dx)
-            if "r" in self._drag_mode:
+            if bits & R:
                 g.setRight(g.right() + dx)
-            if "t" in self._drag_mode:
+            if bits & T:
                 g.setTop(g.top() + dy)
-            if "b" in self._drag_mode:
+            if bits & B:
                 g.setBottom(g.bottom() + dy)
 
             # Enforce min width by re-adjusting the dragged edge.
             if g.width() < min_w:
-                if "l" in self._drag_mode:
+                if bits & L:
                     g.setLeft(g.right() - min_w)
                 else:
                     g.setRight(g.left() + min_w)
 
             # Enforce min height by re-adjusting the dragged edge.
             if g.height() < min_h:
-                if "t" in self._drag_mode:
+                if bits & T:
                     g.setTop(g.bottom() - min_h)
                 else:
                     g.setBottom(g.top() + min_h)
 
-        # Apply to widget and notify region listeners continuously.
-        self._w.setGeometry(g)
-        self._region.emit(reason="drag")
+        # Buffer the target; the geometry timer applies the latest one and notifies region listeners.
+        self._pending_geom = g
+        if not self._geom_timer.isActive():
+            self._geom_timer.start()
         return True
 
+    def _apply_pending_geom(self) -> None:
+        """Apply the most recent buffered drag geometry and notify region listeners (coalesced by RegionEmitter)."""
+        g = self._pending_geom
+        if g is None:
+            return
+        self._pending_geom = None
+        self._w.setGeometry(g)
+        self._cached_inner = None
+        self._geom_cache = None
+        # A pure move keeps the client size, so the emitter can skip re-reading it.
+        self._region.emit(reason="drag", move_only=self._drag_bits == MOVE)
+
     @property
     def is_dragging(self) -> bool:
         """Return True when the current input/state matches the 'dragging' condition."""
@@ -321,8 +419,13 @@ class SelectorInteractor:
         - ensure any consumers see a "final" region even if they debounce drag events,
         - provide a clean boundary for "user finished interaction".
         """
+        # Land the final buffered geometry (while the drag bits still describe it); the
+        # synchronous release emit supersedes any pending drag emit.
+        self._geom_timer.stop()
+        self._apply_pending_geom()
         self._drag_mode = "none"
-        self._region.emit(reason="release")
+        self._drag_bits = MOVE
+        self._region.flush_now(reason="release")
 
     def close_requested(self, *, pos: QPoint) -> bool:
         """
@@ -332,5 +435,5 @@ class SelectorInteractor:
         - higher-level event filters to pre-check close intent,
         - keyboard / other input paths to share the same hit-test.
         """
-        inner_top = self._grid.inner_rect(self._w.rect()).top()
+        inner_top = self._inner().top()
         return self._chrome.close_rect(widget_w=self._w.width(), inner_top=inner_top).contains(pos)
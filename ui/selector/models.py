@@ -13,7 +13,7 @@ from typing import Literal
 ResizeMode = Literal["none", "move", "l", "r", "t", "b", "tl", "tr", "bl", "br"]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class UiRegion:
     """
     UI-facing region model for the selector window.
@@ -3,15 +3,33 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import AbstractSet, Sequence
 
-from PySide6.QtCore import QRect, Qt
-from PySide6.QtGui import QColor, QFont, QFontMetrics, QPainter, QPen
+from PySide6.QtCore import QLine, QRect, Qt
+from PySide6.QtGui import QColor, QFont, QPainter, QPainterPath, QPen, QPixmap
 
 from ui.selector.chrome import ChromeUi
-from ui.selector.models import clamp_int
+from ui.selector.grid import GridGeometry, base_font, label_advance, label_font, label_metrics
 
 
-@dataclass(frozen=True)
+# Static-layer cache key: (widget_w, widget_h, dpr, inner l/t/w/h, edge counts, disabled mask, labels shown).
+_StaticKey = tuple[int, int, float, int, int, int, int, int, int, int, bool]
+
+# Upper bound on cached badge pixmaps (a few size classes worth of labels).
+_BADGE_CACHE_MAX = 256
+
+
+@lru_cache(maxsize=1)
+def _state_font() -> QFont:
+    """Bold 14px font for the overlay state line (shared; callers must not mutate it)."""
+    f = QFont(base_font())
+    f.setPixelSize(14)
+    f.setBold(True)
+    return f
+
+
+@dataclass(frozen=True, slots=True)
 class PaintConfig:
     """
     Rendering configuration for the selector overlay.
@@ -58,70 +76,322 @@ class SelectorPainter:
         self._cfg = cfg
         self._chrome = chrome
 
-    def _tile_font(self, *, tile_h: int) -> QFont:
+        # Row-major tile rects memoized per layout key (see _tiles_for).
+        self._tile_cache: tuple[int, int, int, int, int, int] | None = None
+        self._tile_rects: list[QRect] = []
+
+        # 1-based tile number strings ("1".."N"), rebuilt only when the tile count changes.
+        self._tile_labels: tuple[str, ...] = ()
+
+        # Dashed internal grid lines as one path, keyed like the tile cache; drawn with a
+        # single drawPath so the dash pattern is computed once per path rather than per line.
+        self._grid_path_cache: tuple[tuple[int, int, int, int, int, int], QPainterPath] | None = None
+        self._border_pen = QPen(Qt.GlobalColor.cyan)
+        self._border_pen.setWidth(int(cfg.border_px))
+        self._grid_pen = QPen(Qt.GlobalColor.cyan)
+        self._grid_pen.setWidth(int(cfg.grid_line_px))
+        self._grid_pen.setStyle(Qt.PenStyle.DashLine)
+
+        # Pre-rendered badge atlas: (bw, bh, pixmap) per (font px, pad, tile w, tile h, label, DPR).
+        # Most tiles share one size class.
+        self._badge_cache: dict[tuple[int, int, int, int, str, float], tuple[int, int, QPixmap]] = {}
+
+        # Border + grid + disabled overlays + tile labels rendered once per (size, layout,
+        # disabled set, label visibility) and blitted on every other paint (hover/chrome/state
+        # repaints, move-only drags).
+        self._static_key: _StaticKey | None = None
+        self._static_pm: QPixmap | None = None
+
+        # Overlay state line pre-rendered per (label, widget_w, inner_top, DPR); it only
+        # changes on state changes and resizes, so normal paints are a single blit.
+        self._state_label_cache: tuple[tuple[str, int, int, float], QPixmap] | None = None
+
+    def invalidate_caches(self) -> None:
+        """Drop memoized layout/font state (call after mutating PaintConfig)."""
+        self._static_key = None
+        self._static_pm = None
+        self._tile_cache = None
+        self._tile_rects = []
+        self._tile_labels = ()
+        self._grid_path_cache = None
+        self._state_label_cache = None
+        self._badge_cache.clear()
+
+    def _tiles_for(self, *, inner: QRect, x_edges: Sequence[int], y_edges: Sequence[int]) -> list[QRect]:
         """
-        Choose a bold font sized proportionally to tile height.
+        Return row-major tile rects for this layout, rebuilding only when it changes.
+
+        Edges are a pure function of (span, parts) and always end at the span, so the
+        inner rect plus the edge counts fully identify the layout.
 
-        The clamp avoids:
-        - too small (unreadable) labels on small regions
-        - overly large labels that dominate the tile on large regions
+        Tile rects are shrunk by one pixel on bottom/right to avoid overpainting the next
+        tile boundary due to inclusive QRect edges (built directly at the reduced size, which
+        is identical to adjusted(0, 0, -1, -1) without the temporary QRect).
         """
-        px = clamp_int(int(round(tile_h * 0.24)), 10, 32)
-        f = QFont()
-        f.setPixelSize(px)
-        f.setBold(True)
-        return f
+        left = inner.left()
+        top = inner.top()
+        k = (left, top, inner.width(), inner.height(), len(x_edges), len(y_edges))
+        if k == self._tile_cache:
+            return self._tile_rects
+
+        # Absolute edge coordinates, hoisted out of the nested loop.
+        abs_x = [left + xe for xe in x_edges]
+        abs_y = [top + ye for ye in y_edges]
+
+        rects: list[QRect] = []
+        for row in range(len(abs_y) - 1):
+            y0 = abs_y[row]
+            y1 = abs_y[row + 1]
+            for col in range(len(abs_x) - 1):
+                x0 = abs_x[col]
+                x1 = abs_x[col + 1]
+                rects.append(QRect(x0, y0, max(1, x1 - x0) - 1, max(1, y1 - y0) - 1))
+        self._tile_rects = rects
+        self._tile_cache = k
+        return rects
+
+    def _grid_path(self, *, inner: QRect, x_edges: Sequence[int], y_edges: Sequence[int]) -> QPainterPath:
+        """Return the internal grid-line path for this layout, rebuilding only when it changes."""
+        k = (inner.left(), inner.top(), inner.width(), inner.height(), len(x_edges), len(y_edges))
+        cached = self._grid_path_cache
+        if cached is not None and cached[0] == k:
+            return cached[1]
+
+        # Internal column/row boundaries (skip 0 and last edge).
+        path = GridGeometry.line_path(
+            inner.left(), inner.top(), inner.right(), inner.bottom(), tuple(x_edges), tuple(y_edges)
+        )
+        self._grid_path_cache = (k, path)
+        return path
+
+    def _tile_font(self, *, font_px: int) -> QFont:
+        """
+        Return the bold tile label font for a clamped pixel size (GridGeometry.label_font_px).
 
-    def _draw_centered_tile_label(self, p: QPainter, *, tile: QRect, label: str) -> None:
+        Uses grid.py's per-size cached fonts, so label hit-testing always matches what is drawn.
+        """
+        return label_font(font_px)
+
+    def _draw_centered_tile_label(
+        self,
+        p: QPainter,
+        *,
+        tile: QRect,
+        label: str,
+        font_px: int,
+        pad: int,
+        dpr: float,
+        label_bg: QColor,
+        label_fg: QColor,
+    ) -> None:
         """
         Draw a rounded-rect badge centered within a tile, then draw the label centered in the badge.
 
         The badge size is derived from:
-        - label text metrics (QFontMetrics)
+        - label advance width, memoized per (font px, label) and shared with badge hit-testing
         - padding scaled to tile size
         and then clamped to never exceed the tile itself.
-        """
-        fm = QFontMetrics(p.font())
-        tw = fm.horizontalAdvance(label)
-        th = fm.height()
-
-        pad = clamp_int(int(round(min(tile.width(), tile.height()) * 0.06)), 4, 10)
-        bw = min(tile.width(), tw + 2 * pad)
-        bh = min(tile.height(), th + 2 * pad)
-
-        bx = tile.left() + max(0, (tile.width() - bw) // 2)
-        by = tile.top() + max(0, (tile.height() - bh) // 2)
-        bg = QRect(bx, by, bw, bh)
-
-        # Badge background (no outline).
-        p.setPen(Qt.PenStyle.NoPen)
-        p.setBrush(self._cfg.tile_label_bg)
-        radius = clamp_int(int(round(min(bg.width(), bg.height()) * 0.22)), 4, 12)
-        p.drawRoundedRect(bg, radius, radius)
 
-        # Label text.
-        p.setPen(self._cfg.tile_label_fg)
-        p.drawText(bg, Qt.AlignmentFlag.AlignCenter, label)
+        `font_px`/`pad` are computed once per paint (GridGeometry.label_font_px/label_pad); the
+        font and its metrics come from the shared per-size caches, so no QFontMetrics is built here.
+        Badges are rasterized once per (font_px, pad, tile size, label, DPR) into a small pixmap
+        and blitted afterwards, so steady-state paints do no text shaping. Colors are passed
+        in by _draw_tile_labels() so the per-tile call does no config lookups.
+        """
+        tile_w = tile.width()
+        tile_h = tile.height()
+        key = (font_px, pad, tile_w, tile_h, label, dpr)
+        entry = self._badge_cache.get(key)
+        if entry is None:
+            tw = label_advance(font_px, label)
+            th = label_metrics(font_px).height()
+
+            bw = min(tile_w, tw + 2 * pad)
+            bh = min(tile_h, th + 2 * pad)
+            radius = min(12, max(4, (min(bw, bh) * 22 + 50) // 100))
+
+            pm = QPixmap(max(1, int(round(bw * dpr))), max(1, int(round(bh * dpr))))
+            pm.setDevicePixelRatio(dpr)
+            pm.fill(Qt.GlobalColor.transparent)
+            q = QPainter(pm)
+            q.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+            q.setFont(self._tile_font(font_px=font_px))
+            bg = QRect(0, 0, bw, bh)
+
+            # Badge background (no outline).
+            q.setPen(Qt.PenStyle.NoPen)
+            q.setBrush(label_bg)
+            q.drawRoundedRect(bg, radius, radius)
+
+            # Label text.
+            q.setPen(label_fg)
+            q.drawText(bg, Qt.AlignmentFlag.AlignCenter, label)
+            q.end()
+
+            # Resizing produces a new size class per frame; keep the atlas bounded.
+            if len(self._badge_cache) >= _BADGE_CACHE_MAX:
+                self._badge_cache.clear()
+            entry = (bw, bh, pm)
+            self._badge_cache[key] = entry
+        bw, bh, pm = entry
+
+        bx = tile.left() + max(0, (tile_w - bw) // 2)
+        by = tile.top() + max(0, (tile_h - bh) // 2)
+        p.drawPixmap(bx, by, pm)
+
+    def _state_label_pixmap(self, *, label: str, widget_w: int, inner_top: int, dpr: float) -> QPixmap:
+        """
+        Return the overlay state line rendered into a pixmap covering its text rect.
 
-    def _draw_disabled_overlay(self, p: QPainter, tile: QRect) -> None:
+        The rect is (10, 0, widget_w - 80, inner_top) in widget coordinates, the area the
+        text used to be drawn into directly; callers blit the pixmap at (10, 0).
         """
-        Draw a disabled mask over a tile:
+        key = (label, widget_w, inner_top, dpr)
+        cached = self._state_label_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        w = max(1, widget_w - 80)
+        h = max(1, inner_top)
+        pm = QPixmap(max(1, int(round(w * dpr))), max(1, int(round(h * dpr))))
+        pm.setDevicePixelRatio(dpr)
+        pm.fill(Qt.GlobalColor.transparent)
+        q = QPainter(pm)
+        q.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        q.setPen(QColor(255, 255, 255, 230))
+        q.setFont(_state_font())
+        q.drawText(QRect(0, 0, w, h), Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft, label)
+        q.end()
+
+        self._state_label_cache = (key, pm)
+        return pm
+
+    def _draw_disabled_overlays(self, p: QPainter, tiles: list[QRect]) -> None:
+        """
+        Draw a disabled mask over each tile:
         - translucent fill
         - a prominent "X" using disabled_x_pen
 
-        p.save()/restore() keeps any pen/brush changes local to this overlay.
+        All fills go out in one drawRects call (antialiasing off: they are axis-aligned) and
+        all X strokes in one drawLines call. p.save()/restore() keeps the pen/brush/hint
+        changes local to the overlays.
         """
+        x_lines: list[QLine] = []
+        for tile in tiles:
+            l = tile.left()
+            t = tile.top()
+            r = tile.right()
+            b = tile.bottom()
+            pad = min(14, max(6, (min(r - l + 1, b - t + 1) * 8 + 50) // 100))
+            x_lines.append(QLine(l + pad, t + pad, r - pad, b - pad))
+            x_lines.append(QLine(r - pad, t + pad, l + pad, b - pad))
+
         p.save()
+        p.setRenderHint(QPainter.RenderHint.Antialiasing, False)
         p.setPen(Qt.PenStyle.NoPen)
         p.setBrush(self._cfg.disabled_fill)
-        p.drawRect(tile)
+        p.drawRects(tiles)
 
+        p.setRenderHint(QPainter.RenderHint.Antialiasing, True)
         p.setPen(self._cfg.disabled_x_pen)
-        pad = clamp_int(int(round(min(tile.width(), tile.height()) * 0.08)), 6, 14)
-        p.drawLine(tile.left() + pad, tile.top() + pad, tile.right() - pad, tile.bottom() - pad)
-        p.drawLine(tile.right() - pad, tile.top() + pad, tile.left() + pad, tile.bottom() - pad)
+        p.drawLines(x_lines)
         p.restore()
 
+    def _draw_tile_labels(self, p: QPainter, *, inner: QRect, tiles: list[QRect], dpr: float) -> None:
+        """Draw 1-based tile number badges for every tile (font size tied to the nominal tile height)."""
+        rows = int(self._cfg.grid_rows)
+        cols = int(self._cfg.grid_cols)
+        label_bg = self._cfg.tile_label_bg
+        label_fg = self._cfg.tile_label_fg
+        font_h = max(1, inner.height() // rows)
+        font_px = GridGeometry.label_font_px(font_h)
+        pad = GridGeometry.label_pad(max(1, inner.width() // cols), font_h)
+        labels = self._tile_labels
+        if len(labels) != len(tiles):
+            labels = tuple(str(i + 1) for i in range(len(tiles)))
+            self._tile_labels = labels
+        for tile, label in zip(tiles, labels):
+            self._draw_centered_tile_label(
+                p,
+                tile=tile,
+                label=label,
+                font_px=font_px,
+                pad=pad,
+                dpr=dpr,
+                label_bg=label_bg,
+                label_fg=label_fg,
+            )
+
+    def _static_layer(
+        self,
+        p: QPainter,
+        *,
+        widget_w: int,
+        widget_h: int,
+        inner: QRect,
+        x_edges: Sequence[int],
+        y_edges: Sequence[int],
+        tiles: list[QRect],
+        disabled_tiles: AbstractSet[int],
+        disabled_mask: int,
+        show_tile_numbers: bool,
+    ) -> QPixmap:
+        """
+        Return a transparent widget-sized pixmap holding the border, grid lines, disabled overlays
+        and (optionally) tile number badges.
+
+        Rebuilt only when the widget size, device pixel ratio, layout, disabled set or label
+        visibility changes; the pixmap matches the target device's DPR so the blit is pixel-exact
+        on HiDPI screens.
+        """
+        dpr = float(p.device().devicePixelRatioF())
+        key: _StaticKey = (
+            widget_w,
+            widget_h,
+            dpr,
+            inner.left(),
+            inner.top(),
+            inner.width(),
+            inner.height(),
+            len(x_edges),
+            len(y_edges),
+            disabled_mask,
+            show_tile_numbers,
+        )
+        if key == self._static_key and self._static_pm is not None:
+            return self._static_pm
+
+        pm = QPixmap(max(1, int(round(widget_w * dpr))), max(1, int(round(widget_h * dpr))))
+        pm.setDevicePixelRatio(dpr)
+        pm.fill(Qt.GlobalColor.transparent)
+        q = QPainter(pm)
+        q.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+
+        # Border around the inner region.
+        q.setPen(self._border_pen)
+        q.setBrush(Qt.BrushStyle.NoBrush)
+        q.drawRect(inner)
+
+        # Grid lines (dashed), one drawPath for the whole grid.
+        q.setPen(self._grid_pen)
+        q.drawPath(self._grid_path(inner=inner, x_edges=x_edges, y_edges=y_edges))
+
+        # Disabled overlays (only the disabled tiles are visited), drawn before labels
+        # so badges stay on top of the "X" strokes.
+        n_tiles = len(tiles)
+        disabled = [tiles[i] for i in disabled_tiles if 0 <= i < n_tiles]
+        if disabled:
+            self._draw_disabled_overlays(q, disabled)
+
+        if show_tile_numbers:
+            self._draw_tile_labels(q, inner=inner, tiles=tiles, dpr=dpr)
+
+        q.end()
+
+        self._static_key = key
+        self._static_pm = pm
+        return pm
+
     def paint(
         self,
         p: QPainter,
@@ -129,25 +399,28 @@ class SelectorPainter:
         widget_w: int,
         widget_h: int,
         inner: QRect,
-        x_edges: list[int],
-        y_edges: list[int],
+        x_edges: Sequence[int],
+        y_edges: Sequence[int],
         show_tile_numbers: bool,
-        disabled_tiles: set[int],
+        disabled_tiles: AbstractSet[int],
         show_overlay_state: bool,
         current_state: str,
+        disabled_mask: int | None = None,
     ) -> None:
         """
         Paint the entire selector overlay.
 
         Args:
             p: active QPainter.
-            widget_w/widget_h: widget size in logical pixels (widget_h not used currently, but kept for symmetry).
+            widget_w/widget_h: widget size in logical pixels (sizes the cached static layer).
             inner: inner rect representing the capture region area.
             x_edges/y_edges: tile boundary offsets relative to inner's left/top:
               - x_edges length == grid_cols + 1; x_edges[0]==0, x_edges[-1]==inner.width()
               - y_edges length == grid_rows + 1; y_edges[0]==0, y_edges[-1]==inner.height()
             show_tile_numbers: whether to draw tile index badges.
             disabled_tiles: set of tile indices (0-based) that should be masked with an "X".
+            disabled_mask: the same set as a bitmask (bit i == tile i), e.g. TilesSync.disabled_mask;
+              derived from disabled_tiles when omitted. Used as the static-layer cache key.
         """
         # Antialiasing improves rounded badges and diagonal "X" lines.
         p.setRenderHint(QPainter.RenderHint.Antialiasing, True)
@@ -155,77 +428,38 @@ class SelectorPainter:
         # Top chrome bar (title area / background).
         self._chrome.draw_bar(p, widget_w=widget_w, inner_top=inner.top())
 
-
-        if show_overlay_state:
-            p.save()
-            p.setPen(QColor(255, 255, 255, 230))
-            f = QFont()
-            f.setPixelSize(14)
-            f.setBold(True)
-            p.setFont(f)
-            label = f"STATE: {str(current_state or 'UNKNOWN')}"
-            p.drawText(QRect(10, 0, max(1, widget_w - 80), max(1, inner.top())), Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft, label)
-            p.restore()
-
-        # Border around the inner region.
-        pen = QPen(Qt.GlobalColor.cyan)
-        pen.setWidth(int(self._cfg.border_px))
-        p.setPen(pen)
-        p.setBrush(Qt.BrushStyle.NoBrush)
-        p.drawRect(inner)
-
-        # Grid lines (dashed).
-        pen2 = QPen(Qt.GlobalColor.cyan)
-        pen2.setWidth(int(self._cfg.grid_line_px))
-        pen2.setStyle(Qt.PenStyle.DashLine)
-        p.setPen(pen2)
-
-        # Cache rect edges to avoid repeated Qt calls in loops.
-        left = inner.left()
-        top = inner.top()
-        right = inner.right()
-        bottom = inner.bottom()
-
-        # Vertical grid lines at each internal column boundary (skip 0 and last edge).
-        for i in range(1, int(self._cfg.grid_cols)):
-            x = left + x_edges[i]
-            p.drawLine(x, top, x, bottom)
-
-        # Horizontal grid lines at each internal row boundary.
-        for i in range(1, int(self._cfg.grid_rows)):
-            y = top + y_edges[i]
-            p.drawLine(left, y, right, y)
-
-        # Disabled overlays per tile.
-        # Tile rects are built from x_edges/y_edges and then adjusted(-1,-1) on bottom/right
-        # to avoid overpainting the next tile boundary due to inclusive QRect edges.
-        for row in range(int(self._cfg.grid_rows)):
-            y0 = top + y_edges[row]
-            y1 = top + y_edges[row + 1]
-            for col in range(int(self._cfg.grid_cols)):
-                x0 = left + x_edges[col]
-                x1 = left + x_edges[col + 1]
-                tile = QRect(x0, y0, max(1, x1 - x0), max(1, y1 - y0)).adjusted(0, 0, -1, -1)
-                idx0 = row * int(self._cfg.grid_cols) + col
-                if idx0 in disabled_tiles:
-                    self._draw_disabled_overlay(p, tile)
-
-        # Tile numbers (1-based labels for user readability).
-        if show_tile_numbers:
-            # Font size is tied to tile height (inner height divided by rows).
-            p.setFont(self._tile_font(tile_h=max(1, inner.height() // int(self._cfg.grid_rows))))
-            for row in range(int(self._cfg.grid_rows)):
-                y0 = top + y_edges[row]
-                y1 = top + y_edges[row + 1]
-                for col in range(int(self._cfg.grid_cols)):
-                    x0 = left + x_edges[col]
-                    x1 = left + x_edges[col + 1]
-                    tile = QRect(x0, y0, max(1, x1 - x0), max(1, y1 - y0)).adjusted(0, 0, -1, -1)
-                    self._draw_centered_tile_label(
-                        p,
-                        tile=tile,
-                        label=str(row * int(self._cfg.grid_cols) + col + 1),
-                    )
+        if show_overlay_state and current_state:
+            pm = self._state_label_pixmap(
+                label=f"STATE: {current_state}",
+                widget_w=widget_w,
+                inner_top=inner.top(),
+                dpr=float(p.device().devicePixelRatioF()),
+            )
+            p.drawPixmap(10, 0, pm)
+
+        if disabled_mask is None:
+            disabled_mask = 0
+            for i in disabled_tiles:
+                disabled_mask |= 1 << i
+
+        # Border, dashed grid, disabled overlays and tile numbers come from the cached static layer.
+        tiles = self._tiles_for(inner=inner, x_edges=x_edges, y_edges=y_edges)
+        p.drawPixmap(
+            0,
+            0,
+            self._static_layer(
+                p,
+                widget_w=widget_w,
+                widget_h=widget_h,
+                inner=inner,
+                x_edges=x_edges,
+                y_edges=y_edges,
+                tiles=tiles,
+                disabled_tiles=disabled_tiles,
+                disabled_mask=disabled_mask,
+                show_tile_numbers=show_tile_numbers,
+            ),
+        )
 
         # Close button on top of everything (so it remains visible).
         self._chrome.draw_close_button(p, widget_w=widget_w, inner_top=inner.top())
@@ -2,16 +2,21 @@
 
 from __future__ import annotations
 
+import logging
 from dataclasses import dataclass
 from typing import Callable, Optional
 
+from PySide6.QtCore import QObject, QTimer
+
 from analyzer.capture import Region
 
-from ui.win32_dpi import dpi_for_window, scale_for_window
-from ui.win_geometry import get_client_rect_in_screen_px
+from ui.win32_dpi import dpi_for_window
+from ui.win_geometry import WinRect, get_client_origin_in_screen_px, get_client_rect_in_screen_px
+
+_LOG = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class _DpiDiagState:
     """
     Simple "last seen" cache used to avoid spamming DPI diagnostics logs.
@@ -54,6 +59,7 @@ class RegionEmitter:
         border_px: int,
         emit_inset_px: int,
         chrome_bar_h_px: int,
+        parent: Optional[QObject] = None,
     ) -> None:
         # Provider for HWND (Win32 window handle) of the overlay.
         self._win_id = win_id
@@ -71,26 +77,77 @@ class RegionEmitter:
         self._border_px = int(border_px)
         self._emit_inset_px = int(emit_inset_px)
         self._chrome_bar_h_px = int(chrome_bar_h_px)
+        self._inset_logical = max(0, self._border_px + self._emit_inset_px)
+
+        # Inset/chrome sizes converted to physical px for the last scale: (scale, inset_px, chrome_px).
+        self._scaled_px: tuple[float, int, int] = (1.0, self._inset_logical, self._chrome_bar_h_px)
 
         # Diagnostic "last log" state to prevent log spam.
         self._dbg = _DpiDiagState()
 
+        # Last Win32 DPI lookup for the overlay HWND. Refreshed when the HWND changes, when
+        # the window lands on another screen / Qt DPR changes, or on invalidate_dpi_cache().
+        self._cached_hwnd: Optional[int] = None
+        self._cached_dpi: int = 96
+        self._cached_scale: float = 1.0
+
+        # Last client size seen per (HWND, scale): (hwnd, scale, width, height). Move-only drag
+        # emits reuse it and ask Win32 for the client origin alone.
+        self._cached_client_size: Optional[tuple[int, float, int, int]] = None
+
+        # Emits are coalesced to at most one per ~16 ms (one display frame); the latest
+        # reason wins. Downstream capture reconfiguration is too costly to run per mouse sample.
+        # The timer is parented to the owning window so it cannot outlive it; call cancel() on close.
+        self._pending_reason: Optional[str] = None
+        self._pending_move_only = False
+        self._debounce = QTimer(parent)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(16)
+        self._debounce.timeout.connect(self._flush)  # type: ignore[arg-type]
+
+    def invalidate_dpi_cache(self) -> None:
+        """
+        Force the next emit to re-query the Win32 DPI (e.g. on a screen change).
+
+        Emits only re-check Qt DPR / screen info while this cache is cold, so the owner must
+        call this on screen and screen-DPI changes.
+        """
+        self._cached_hwnd = None
+
+    def _window_scale(self, hwnd: int) -> float:
+        """Return the Win32 DPI scale for `hwnd`, querying Win32 only on a cache miss."""
+        if hwnd != self._cached_hwnd:
+            self._cached_dpi = dpi_for_window(hwnd)
+            self._cached_scale = float(self._cached_dpi) / 96.0
+            self._cached_hwnd = hwnd
+        return self._cached_scale
+
     def _log_dpi_if_changed(self, *, reason: str) -> None:
         """
-        Print a one-line DPI diagnostic whenever key DPI-related inputs change.
+        Log a one-line DPI diagnostic (DEBUG level) whenever key DPI-related inputs change.
 
         This helps confirm that:
         - Win32 DPI awareness/scaling is behaving as expected,
         - Qt DPR is stable or changes when moving between monitors,
         - Qt's reported screen logical DPI aligns with DPR and physical DPI expectations.
 
-        The data printed here is diagnostic only; region computation uses Win32 client px.
+        The data logged here is diagnostic only; region computation uses Win32 client px.
+
+        This is also where the cached Win32 DPI is invalidated: a different screen or Qt DPR
+        means the window may have crossed onto a monitor with another scale.
+
+        Only called while the DPI cache is cold (first emit, new HWND, or after
+        invalidate_dpi_cache()), so steady-state emits skip the Qt DPR and screen queries.
         """
         hwnd = int(self._win_id())
-        win_dpi = dpi_for_window(hwnd)
         qt_dpr = float(self._qt_dpr())
 
         screen_name, screen_logical, screen_phys = self._screen_info()
+        if self._dbg.last_screen_name != screen_name or self._dbg.last_qt_dpr != qt_dpr:
+            self.invalidate_dpi_cache()
+        self._window_scale(hwnd)
+        win_dpi = self._cached_dpi
+
         changed = (
             self._dbg.last_screen_name != screen_name
             or self._dbg.last_win_dpi != win_dpi
@@ -103,33 +160,82 @@ class RegionEmitter:
         self._dbg.last_win_dpi = win_dpi
         self._dbg.last_qt_dpr = qt_dpr
 
+        if not _LOG.isEnabledFor(logging.DEBUG):
+            return
+
         # A rough expectation check: logical DPI * DPR should be close to "effective" DPI.
         expected_from_qt = screen_logical * qt_dpr if screen_logical > 0 else -1.0
-
-        """
-        print(
-            "[dpi]",
-            "reason=",
+        _LOG.debug(
+            "dpi reason=%s screen=%s win_dpi=%s scale=%.4f qt_dpr=%.4f qt_screen_logical_dpi=%.2f "
+            "qt_screen_physical_dpi=%.2f expected_from_qt(logical*dpr)=%.2f",
             reason,
-            "screen=",
             screen_name,
-            "win_dpi=",
             win_dpi,
-            "scale=",
-            round(scale_for_window(hwnd), 4),
-            "qt_dpr=",
-            round(qt_dpr, 4),
-            "qt_screen_logical_dpi=",
-            round(screen_logical, 2),
-            "qt_screen_physical_dpi=",
-            round(screen_phys, 2),
-            "expected_from_qt(logical*dpr)=",
-            round(expected_from_qt, 2),
-            flush=True,
+            self._cached_scale,
+            qt_dpr,
+            screen_logical,
+            screen_phys,
+            expected_from_qt,
         )
+
+    def emit(self, *, reason: str, move_only: bool = False) -> None:
+        """
+        Schedule a coalesced region emit.
+
+        Bursts (e.g. drag at pointer rate) collapse into one emit per ~16 ms frame carrying
+        the most recent reason. Use flush_now() where the emit must happen synchronously.
+
+        `move_only` marks emits where the window was only moved (client size unchanged); the
+        coalesced emit takes the cheaper origin-only path only if every merged emit was move-only.
         """
+        if self._pending_reason is None:
+            self._pending_move_only = move_only
+        else:
+            self._pending_move_only = self._pending_move_only and move_only
+        self._pending_reason = reason
+        if not self._debounce.isActive():
+            self._debounce.start()
+
+    def flush_now(self, *, reason: Optional[str] = None) -> None:
+        """Cancel any pending coalesced emit and emit immediately (e.g. at the end of a drag)."""
+        self._debounce.stop()
+        r = reason or self._pending_reason or "flush"
+        self._pending_reason = None
+        self._pending_move_only = False
+        self._do_emit(reason=r)
+
+    def cancel(self) -> None:
+        """Drop any pending coalesced emit without emitting (e.g. when the window closes)."""
+        self._debounce.stop()
+        self._pending_reason = None
+        self._pending_move_only = False
+
+    def _flush(self) -> None:
+        """Timer slot: perform the pending coalesced emit."""
+        r = self._pending_reason or "debounced"
+        move_only = self._pending_move_only
+        self._pending_reason = None
+        self._pending_move_only = False
+        self._do_emit(reason=r, move_only=move_only)
+
+    def _client_rect(self, hwnd: int, *, scale: float, move_only: bool) -> WinRect:
+        """
+        Client rect in physical screen px.
 
-    def emit(self, *, reason: str) -> None:
+        For move-only emits with a cached size for this HWND and scale, only the client origin
+        is queried (one Win32 call instead of two); otherwise the full rect is fetched and its
+        size cached. A scale change invalidates the size, since moving onto a monitor with a
+        different DPI resizes the physical client area.
+        """
+        c = self._cached_client_size
+        if move_only and c is not None and c[0] == hwnd and c[1] == scale:
+            left, top = get_client_origin_in_screen_px(hwnd)
+            return WinRect(left=left, top=top, right=left + c[2], bottom=top + c[3])
+        client = get_client_rect_in_screen_px(hwnd)
+        self._cached_client_size = (hwnd, scale, client.width, client.height)
+        return client
+
+    def _do_emit(self, *, reason: str, move_only: bool = False) -> None:
         """
         Emit capture region in *physical screen pixels*.
 
@@ -145,25 +251,32 @@ class RegionEmitter:
         Failure modes:
         - If the HWND is invalid/closing, get_client_rect_in_screen_px may raise OSError; we bail out silently.
         """
-        self._log_dpi_if_changed(reason=reason)
-
         hwnd = int(self._win_id())
+        if hwnd != self._cached_hwnd:
+            self._log_dpi_if_changed(reason=reason)
+
+        # Win32 scale factor for this window; used to convert logical UI pixels -> physical pixels.
+        scale = self._window_scale(hwnd)
+
         try:
             # client is in physical screen pixels: left/top (screen coords), width/height (px)
-            client = get_client_rect_in_screen_px(hwnd)
+            client = self._client_rect(hwnd, scale=scale, move_only=move_only)
         except OSError:
             # Window may have been destroyed or not ready.
             return
 
-        # Win32 scale factor for this window; used to convert logical UI pixels -> physical pixels.
-        scale = scale_for_window(hwnd)
-
-        # The inset is specified in logical pixels; convert to physical pixels.
-        inset_logical = max(0, self._border_px + self._emit_inset_px)
-        inset_px = int(round(float(inset_logical) * scale))
-
-        # Chrome bar is logical height; convert to physical pixels too.
-        chrome_px = int(round(float(self._chrome_bar_h_px) * scale))
+        # The inset and chrome bar height are specified in logical pixels; convert to physical
+        # pixels (recomputed only when the scale changes).
+        inset_logical = self._inset_logical
+        scaled = self._scaled_px
+        if scaled[0] != scale:
+            scaled = (
+                scale,
+                int(round(float(inset_logical) * scale)),
+                int(round(float(self._chrome_bar_h_px) * scale)),
+            )
+            self._scaled_px = scaled
+        _, inset_px, chrome_px = scaled
 
         # Compute the final capture region:
         # - start at client left/top
@@ -175,24 +288,18 @@ class RegionEmitter:
         h = client.height - chrome_px - (2 * inset_px)
 
         # Verbose diagnostics for troubleshooting "off by N px" issues (e.g., mixed DPI, border math).
-        print(
-            "[emit_region]",
-            "reason=",
-            reason,
-            "client=",
-            (client.left, client.top, client.width, client.height),
-            "region=",
-            (x, y, w, h),
-            "scale=",
-            round(scale, 4),
-            "inset_logical=",
-            inset_logical,
-            "inset_px=",
-            inset_px,
-            "chrome_px=",
-            chrome_px,
-            flush=True,
-        )
+        # Guarded so the drag hot path pays nothing (no formatting, no stdout flush) unless enabled.
+        if _LOG.isEnabledFor(logging.DEBUG):
+            _LOG.debug(
+                "emit_region reason=%s client=%s region=%s scale=%.4f inset_logical=%d inset_px=%d chrome_px=%d",
+                reason,
+                (client.left, client.top, client.width, client.height),
+                (x, y, w, h),
+                scale,
+                inset_logical,
+                inset_px,
+                chrome_px,
+            )
 
         # Guard against degenerate geometry.
         if w < 1 or h < 1:
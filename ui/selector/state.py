@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
 from PySide6.QtCore import QPoint, QRect
@@ -10,7 +10,7 @@ from PySide6.QtCore import QPoint, QRect
 from ui.selector.models import ResizeMode
 
 
-@dataclass
+@dataclass(slots=True)
 class DragState:
     """
     Tracks an active pointer drag interaction.
@@ -24,11 +24,11 @@ class DragState:
       to this baseline geometry.
     """
     mode: ResizeMode = "none"
-    start_pos_global: QPoint = QPoint(0, 0)
-    start_geom: QRect = QRect()
+    start_pos_global: QPoint = field(default_factory=QPoint)
+    start_geom: QRect = field(default_factory=QRect)
 
 
-@dataclass
+@dataclass(slots=True)
 class SelectorVisualState:
     """
     Aggregated UI state used by the selector overlay for rendering and interaction.
@@ -44,7 +44,7 @@ class SelectorVisualState:
     - drag defaults to a fresh DragState so callers can mutate drag.mode/start_* during interactions.
     """
     show_tile_numbers: bool
-    drag: DragState = DragState()
+    drag: DragState = field(default_factory=DragState)
     min_w: int = 120
     min_h: int = 90
     last_cursor_mode: Optional[ResizeMode] = None
@@ -15,6 +15,46 @@ from ui.selector.window import SelectorWindow
 from ui.selector.models import UiRegion
 from ui.tiles_sync import TilesSync, TilesSyncConfig
 
+# How often the Qt loop checks quit_flag (also gives Python a chance to run the SIGINT handler).
+_QUIT_POLL_MS = 200
+
+
+def _install_quit_poller(
+    app: QApplication,
+    w: SelectorWindow,
+    quit_flag: threading.Event,
+    interval_ms: int = _QUIT_POLL_MS,
+) -> QTimer:
+    """
+    Start a timer that closes the window and quits the app once quit_flag is set.
+
+    The caller must keep the returned timer referenced for the lifetime of the event loop.
+    """
+    quit_timer = QTimer()
+    quit_timer.setInterval(int(interval_ms))
+
+    def on_quit_tick() -> None:
+        """On quit tick."""
+        try:
+            if quit_flag.is_set():
+                quit_timer.stop()
+                w.close()
+                app.quit()
+        except KeyboardInterrupt:
+            # On Windows, Ctrl-C can surface during Qt timer callbacks.
+            # Treat it as a graceful shutdown signal instead of printing a traceback.
+            quit_flag.set()
+            quit_timer.stop()
+            try:
+                w.close()
+            except Exception:
+                pass
+            app.quit()
+
+    quit_timer.timeout.connect(on_quit_tick)  # type: ignore[arg-type]
+    quit_timer.start()
+    return quit_timer
+
 
 def run_selector_ui(
     *,
@@ -48,7 +88,8 @@ def run_selector_ui(
         raise ValueError("server_base_url_override must be provided (e.g. http://127.0.0.1:8735)")
 
     tiles_url = f"{base}/tiles"
-    ui_settings_url = f"{base}/ui"
+    # Combined settings + disabled tiles: one request per cycle covers both pollers.
+    ui_settings_url = f"{base}/ui/state"
 
     tiles_sync = TilesSync(
         TilesSyncConfig(
@@ -96,29 +137,8 @@ def run_selector_ui(
 
     signal.signal(signal.SIGINT, _handle_sigint)
 
-    quit_timer = QTimer()
-    quit_timer.setInterval(1000/25)
-
-    def on_quit_tick() -> None:
-        """On quit tick."""
-        try:
-            if quit_flag.is_set():
-                quit_timer.stop()
-                w.close()
-                app.quit()
-        except KeyboardInterrupt:
-            # On Windows, Ctrl-C can surface during Qt timer callbacks.
-            # Treat it as a graceful shutdown signal instead of printing a traceback.
-            quit_flag.set()
-            quit_timer.stop()
-            try:
-                w.close()
-            except Exception:
-                pass
-            app.quit()
-
-    quit_timer.timeout.connect(on_quit_tick)  # type: ignore[arg-type]
-    quit_timer.start()
+    # Keep a reference so the poller lives for the whole event loop.
+    quit_timer = _install_quit_poller(app, w, quit_flag)
 
     try:
         app.exec()
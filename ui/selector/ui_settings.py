@@ -4,15 +4,49 @@
 from __future__ import annotations
 
 import json
-import threading
+import random
+import sys
 from dataclasses import dataclass
 from typing import Optional
-from urllib.request import Request, urlopen
 
-from PySide6.QtCore import QObject, QTimer, Signal
+from PySide6.QtCore import QObject, QTimer, QUrl, Signal
+from PySide6.QtNetwork import QNetworkAccessManager, QNetworkReply, QNetworkRequest
 
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional dependency at runtime
+    orjson = None
 
-@dataclass(frozen=True)
+try:
+    from pydantic import BaseModel, ConfigDict, ValidationError
+except Exception:  # pragma: no cover - optional dependency at runtime
+    BaseModel = None
+    ConfigDict = None
+    ValidationError = None
+
+
+def _loads(raw: bytes) -> object:
+    """Parse a JSON body straight from bytes (orjson when available, else stdlib json)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def jittered_interval_ms(base_ms: int, jitter_ms: int) -> int:
+    """Return base_ms shifted by a uniform random offset in [-jitter_ms, +jitter_ms] (at least 1)."""
+    if jitter_ms <= 0:
+        return max(1, base_ms)
+    return max(1, base_ms + random.randint(-jitter_ms, jitter_ms))
+
+
+def default_jitter_ms(poll_ms: int, jitter_ms: Optional[int]) -> int:
+    """Explicit jitter if given, otherwise 20% of the poll interval."""
+    if jitter_ms is None:
+        return max(0, int(poll_ms) // 5)
+    return max(0, int(jitter_ms))
+
+
+@dataclass(frozen=True, slots=True)
 class UiSettingsSnapshot:
     show_tile_numbers: bool
     show_overlay_state: bool
@@ -25,9 +59,158 @@ class UiSettingsSnapshot:
     current_state: str
 
 
+# Validated settings in UiSettingsSnapshot field order. Kept as a plain tuple so an
+# unchanged poll is one C-level tuple compare and builds no snapshot at all.
+_Fields = tuple[bool, bool, int, int, int, int, int, int, str]
+
+# Parsed poll result: the settings fields plus disabled_tiles when the payload has them.
+_Parsed = tuple[_Fields, Optional[tuple[int, ...]]]
+
+
+if BaseModel is not None:
+
+    class _Payload(BaseModel):
+        """
+        Strictly typed settings payload, parsed and validated from bytes by pydantic-core.
+
+        Strict mode accepts exactly what the isinstance ladder in _parse_dict accepts for a
+        well-formed payload; anything else raises and falls back to that ladder, which
+        substitutes per-field defaults instead of rejecting the payload.
+        """
+        model_config = ConfigDict(strict=True, extra="ignore")
+
+        show_tile_numbers: bool
+        show_overlay_state: bool = False
+        region_x: int = 0
+        region_y: int = 0
+        region_width: int = 640
+        region_height: int = 480
+        grid_rows: int = 1
+        grid_cols: int = 1
+        current_state: str = "UNKNOWN"
+        disabled_tiles: Optional[list[int]] = None
+
+else:  # pragma: no cover - optional dependency at runtime
+    _Payload = None
+
+
+def _fields(
+    show_numbers: bool,
+    show_overlay: bool,
+    x: int,
+    y: int,
+    w: int,
+    h: int,
+    grid_rows: int,
+    grid_cols: int,
+    state: str,
+) -> _Fields:
+    """
+    Pack validated fields (sizes and grid clamped to >= 1) in snapshot field order.
+
+    Callers pass plain ints (the strict model guarantees it; _parse_dict normalizes), so
+    no int() re-casts are needed here. The state string is interned: the handful of
+    state names then share one object each, and comparisons hit the identity shortcut.
+    """
+    return (
+        show_numbers,
+        show_overlay,
+        x,
+        y,
+        w if w >= 1 else 1,
+        h if h >= 1 else 1,
+        grid_rows if grid_rows >= 1 else 1,
+        grid_cols if grid_cols >= 1 else 1,
+        sys.intern(state),
+    )
+
+
+def _parse_dict(data: object) -> Optional[_Parsed]:
+    """Python validation ladder: wrong-typed optional fields fall back to defaults."""
+    if not isinstance(data, dict):
+        return None
+
+    show_numbers = data.get("show_tile_numbers")
+    show_overlay = data.get("show_overlay_state")
+    x = data.get("region_x")
+    y = data.get("region_y")
+    w = data.get("region_width")
+    h = data.get("region_height")
+    grid_rows = data.get("grid_rows")
+    grid_cols = data.get("grid_cols")
+    state = data.get("current_state")
+
+    if not isinstance(show_numbers, bool):
+        return None
+    if not isinstance(show_overlay, bool):
+        show_overlay = False
+    if not isinstance(x, int):
+        x = 0
+    if not isinstance(y, int):
+        y = 0
+    if not isinstance(w, int):
+        w = 640
+    if not isinstance(h, int):
+        h = 480
+    if not isinstance(grid_rows, int):
+        grid_rows = 1
+    if not isinstance(grid_cols, int):
+        grid_cols = 1
+    if not isinstance(state, str):
+        state = "UNKNOWN"
+
+    # isinstance(True, int) holds, so bools can slip through the ladder; normalize to int.
+    fields = _fields(
+        show_numbers, show_overlay, int(x), int(y), int(w), int(h), int(grid_rows), int(grid_cols), state
+    )
+
+    raw_tiles = data.get("disabled_tiles")
+    tiles = tuple(v for v in raw_tiles if isinstance(v, int)) if isinstance(raw_tiles, list) else None
+    return fields, tiles
+
+
+def _parse_payload(raw: bytes) -> Optional[_Parsed]:
+    """
+    Parse and validate a settings body.
+
+    Well-formed payloads take the compiled pydantic path (one call from bytes); anything
+    it rejects goes through the lenient Python ladder so behavior is unchanged.
+    """
+    if _Payload is not None:
+        try:
+            m = _Payload.model_validate_json(raw)
+        except ValidationError:
+            pass
+        else:
+            fields = _fields(
+                m.show_tile_numbers,
+                m.show_overlay_state,
+                m.region_x,
+                m.region_y,
+                m.region_width,
+                m.region_height,
+                m.grid_rows,
+                m.grid_cols,
+                m.current_state,
+            )
+            return fields, (tuple(m.disabled_tiles) if m.disabled_tiles is not None else None)
+    try:
+        data = _loads(raw)
+    except Exception:
+        return None
+    return _parse_dict(data)
+
+
+# Shared pollers keyed by URL (see UiSettingsPoller.get_or_create). Qt thread only.
+_POLLERS: dict[str, "UiSettingsPoller"] = {}
+
+
 class UiSettingsPoller(QObject):
     valueChanged = Signal(bool)
     settingsChanged = Signal(object)
+    # Emitted with a tuple of ints when the payload carries "disabled_tiles" (the combined
+    # /ui/state endpoint) and the list changed.
+    tilesChanged = Signal(object)
 
     def __init__(
         self,
@@ -35,117 +218,249 @@ class UiSettingsPoller(QObject):
         url: str,
         poll_ms: int,
         timeout_sec: float,
+        poll_jitter_ms: Optional[int] = None,
+        poll_backoff_max_ms: int = 10_000,
         parent: Optional[QObject] = None,
     ) -> None:
         super().__init__(parent)
         self._url = str(url).strip()
         self._poll_ms = int(poll_ms)
+        # Each tick is rescheduled at poll_ms +/- jitter so several overlays (or restarts)
+        # drift apart instead of hitting the server in phase.
+        self._jitter_ms = default_jitter_ms(self._poll_ms, poll_jitter_ms)
+        # Consecutive failures double the next interval (capped) until a poll succeeds again.
+        self._backoff_max_ms = max(self._poll_ms, int(poll_backoff_max_ms))
+        self._fail_count = 0
+        self._running = False
         self._timeout_sec = float(timeout_sec)
 
-        self._lock = threading.Lock()
+        # Poll state below is only touched on the Qt thread (timer slot and reply handler),
+        # so it needs no locking.
         self._in_flight = False
         self._last_value: Optional[bool] = None
         self._last_settings: Optional[UiSettingsSnapshot] = None
+        self._last_fields: Optional[_Fields] = None
+        self._last_tiles: Optional[tuple[int, ...]] = None
+        # ETag of the last successfully applied body; sent as If-None-Match so an unchanged
+        # payload comes back as an empty 304 and is neither downloaded nor parsed.
+        self._etag: Optional[str] = None
+        # Raw body of the last applied payload. Servers without ETag support still tend to
+        # return byte-identical bodies when nothing changed; those skip parsing as well.
+        self._last_raw: Optional[bytes] = None
+
+        # Non-blocking HTTP on the Qt event loop: no worker thread, and the manager keeps
+        # connections alive between polls. no-cache (revalidate) rather than no-store, so
+        # conditional requests stay meaningful.
+        self._nam = QNetworkAccessManager(self)
+        self._request = QNetworkRequest(QUrl(self._url))
+        self._request.setRawHeader(b"Cache-Control", b"no-cache")
+        self._request.setTransferTimeout(max(1, int(self._timeout_sec * 1000)))
+        self._reply: Optional[QNetworkReply] = None
 
         self._timer = QTimer(self)
-        self._timer.setInterval(self._poll_ms)
+        self._timer.setSingleShot(True)
         self._timer.timeout.connect(self.poll)  # type: ignore[arg-type]
 
+        # Number of get_or_create() holders; the shared poller stops when the last one releases.
+        self._subscribers = 0
+        # Number of holders currently wanting updates (see resume/pause).
+        self._active = 0
+
+    @classmethod
+    def get_or_create(
+        cls,
+        *,
+        url: str,
+        poll_ms: int,
+        timeout_sec: float,
+        poll_jitter_ms: Optional[int] = None,
+    ) -> "UiSettingsPoller":
+        """
+        Return the shared poller for `url`, creating it on first use.
+
+        Every caller gets the same instance (one request per interval regardless of how
+        many windows subscribe); a faster requested interval lowers the shared one.
+        Pair each call with release(). Shared pollers are unparented so no single
+        subscriber's lifetime owns them.
+        """
+        key = str(url).strip()
+        p = _POLLERS.get(key)
+        if p is None:
+            p = cls(url=key, poll_ms=poll_ms, timeout_sec=timeout_sec, poll_jitter_ms=poll_jitter_ms)
+            _POLLERS[key] = p
+        elif int(poll_ms) < p._poll_ms:
+            p._poll_ms = int(poll_ms)
+            p._jitter_ms = min(p._jitter_ms, default_jitter_ms(p._poll_ms, poll_jitter_ms))
+        p._subscribers += 1
+        return p
+
+    def release(self) -> None:
+        """Drop one get_or_create() reference; stops and unregisters the poller after the last."""
+        self._subscribers = max(0, self._subscribers - 1)
+        if self._subscribers:
+            return
+        if _POLLERS.get(self._url) is self:
+            del _POLLERS[self._url]
+        self.stop()
+
+    def resume(self) -> None:
+        """Mark one holder as wanting updates; polling runs while at least one does."""
+        self._active += 1
+        if self._active == 1:
+            self.start()
+
+    def pause(self) -> None:
+        """Undo one resume(); polling stops once no holder wants updates (e.g. all hidden)."""
+        if self._active == 0:
+            return
+        self._active -= 1
+        if self._active == 0:
+            self.stop()
+
+    @property
+    def last_settings(self) -> Optional[UiSettingsSnapshot]:
+        """Most recently emitted snapshot (lets late subscribers catch up without a poll)."""
+        return self._last_settings
+
+    @property
+    def last_tiles(self) -> Optional[tuple[int, ...]]:
+        """Most recently emitted disabled_tiles, or None if the endpoint does not provide them."""
+        return self._last_tiles
+
+    def forget_tiles(self) -> None:
+        """
+        Make the next poll re-fetch and re-emit disabled_tiles even if the server is unchanged.
+
+        For callers that changed tiles locally (optimistic toggle): if that write never reached
+        the server, the unchanged payload must still be delivered to reconcile.
+        """
+        self._etag = None
+        self._last_raw = None
+        self._last_tiles = None
+
     def start(self) -> None:
-        """Start background work for this component so it can begin producing updates."""
-        if not self._url:
+        """Start background work for this component so it can begin producing updates (idempotent)."""
+        if not self._url or self._running:
             return
-        self._timer.start()
+        self._running = True
         self.poll()
 
+    def _next_interval_ms(self) -> int:
+        """Base interval, doubled per consecutive failure up to the backoff cap."""
+        if self._fail_count == 0:
+            return self._poll_ms
+        return min(self._backoff_max_ms, self._poll_ms << min(self._fail_count, 16))
+
+    def _on_poll_finished(self, ok: bool) -> None:
+        """Qt-thread slot: update the failure streak and arm the next (jittered) tick."""
+        self._fail_count = 0 if ok else self._fail_count + 1
+        if self._running:
+            self._timer.start(jittered_interval_ms(self._next_interval_ms(), self._jitter_ms))
+
     def stop(self) -> None:
         """Request a clean shutdown for this component and stop ongoing background work."""
+        self._running = False
         try:
             self._timer.stop()
         except Exception:
             pass
+        reply = self._reply
+        if reply is not None:
+            try:
+                reply.abort()
+            except Exception:
+                pass
 
     def poll(self) -> None:
         """Fetch the latest remote/local values and apply them to current UI state."""
         if not self._url:
             return
 
-        with self._lock:
-            if self._in_flight:
-                return
-            self._in_flight = True
+        if self._in_flight:
+            return
+        self._in_flight = True
+        etag = self._etag
+        last_raw = self._last_raw
 
-        url = self._url
-        timeout_sec = self._timeout_sec
+        req = QNetworkRequest(self._request)
+        if etag:
+            req.setRawHeader(b"If-None-Match", etag.encode("latin-1"))
+        reply = self._nam.get(req)
+        self._reply = reply
+        reply.finished.connect(lambda: self._on_reply(reply, last_raw))  # type: ignore[arg-type]
 
-        def worker() -> None:
-            """Run the background worker loop that performs periodic sync work."""
+    def _on_reply(self, reply: QNetworkReply, last_raw: Optional[bytes]) -> None:
+        """Handle a finished request (Qt thread): fast paths, parse, diff/emit, reschedule."""
+        if not self._running or reply.error() == QNetworkReply.NetworkError.OperationCanceledError:
+            # Aborted by stop() (pause/release); Qt emits finished synchronously from abort().
+            # Not a poll outcome: keep the ETag, raw-bytes cache and failure streak as they are.
+            self._in_flight = False
+            if self._reply is reply:
+                self._reply = None
+            reply.deleteLater()
+            return
+        ok = False
+        try:
             try:
-                req = Request(url=url, method="GET", headers={"Cache-Control": "no-store"})
-                with urlopen(req, timeout=timeout_sec) as resp:
-                    raw = resp.read()
-                data = json.loads(raw.decode("utf-8", errors="replace"))
+                status = reply.attribute(QNetworkRequest.Attribute.HttpStatusCodeAttribute)
+                if status == 304:
+                    ok = self._mark_unchanged()
+                    return
+                if reply.error() != QNetworkReply.NetworkError.NoError or not (200 <= int(status or 0) < 300):
+                    raise OSError(reply.errorString())
+                raw = bytes(reply.readAll().data())
+                if last_raw is not None and raw == last_raw:
+                    ok = self._mark_unchanged()
+                    return
+                new_etag = bytes(reply.rawHeader(b"ETag").data()).decode("latin-1") or None
+                parsed = _parse_payload(raw)
             except Exception:
-                data = None
+                raw = None
+                new_etag = None
+                parsed = None
+            ok = self._apply(parsed)
+            # Only remember tag/body once applied; a rejected body must be fetched
+            # (and rejected) again rather than pinned by 304s or the bytes fast path.
+            self._etag = new_etag if ok else None
+            self._last_raw = raw if ok else None
+        finally:
+            if self._reply is reply:
+                self._reply = None
+            reply.deleteLater()
+            # The next tick is scheduled from here, so there is exactly one pending
+            # poll at a time and its delay reflects this poll's outcome.
+            self._on_poll_finished(ok)
 
-            emit_bool: Optional[bool] = None
-            emit_settings: Optional[UiSettingsSnapshot] = None
-            with self._lock:
-                self._in_flight = False
-                if not isinstance(data, dict):
-                    return
+    def _mark_unchanged(self) -> bool:
+        """Finish a poll whose payload matches the last applied one (counts as success)."""
+        self._in_flight = False
+        return True
 
-                show_numbers = data.get("show_tile_numbers")
-                show_overlay = data.get("show_overlay_state")
-                x = data.get("region_x")
-                y = data.get("region_y")
-                w = data.get("region_width")
-                h = data.get("region_height")
-                grid_rows = data.get("grid_rows")
-                grid_cols = data.get("grid_cols")
-                state = data.get("current_state")
-
-                if not isinstance(show_numbers, bool):
-                    return
-                if self._last_value is None or show_numbers != self._last_value:
-                    self._last_value = show_numbers
-                    emit_bool = show_numbers
-
-                if not isinstance(show_overlay, bool):
-                    show_overlay = False
-                if not isinstance(x, int):
-                    x = 0
-                if not isinstance(y, int):
-                    y = 0
-                if not isinstance(w, int):
-                    w = 640
-                if not isinstance(h, int):
-                    h = 480
-                if not isinstance(grid_rows, int):
-                    grid_rows = 1
-                if not isinstance(grid_cols, int):
-                    grid_cols = 1
-                if not isinstance(state, str):
-                    state = "UNKNOWN"
-
-                snap = UiSettingsSnapshot(
-                    show_tile_numbers=show_numbers,
-                    show_overlay_state=show_overlay,
-                    region_x=int(x),
-                    region_y=int(y),
-                    region_width=max(1, int(w)),
-                    region_height=max(1, int(h)),
-                    grid_rows=max(1, int(grid_rows)),
-                    grid_cols=max(1, int(grid_cols)),
-                    current_state=state,
-                )
-                if self._last_settings is None or snap != self._last_settings:
-                    self._last_settings = snap
-                    emit_settings = snap
-
-            if emit_bool is not None:
-                self.valueChanged.emit(emit_bool)
-            if emit_settings is not None:
-                self.settingsChanged.emit(emit_settings)
-
-        threading.Thread(target=worker, name="ui-settings-poll", daemon=True).start()
+    def _apply(self, parsed: Optional[_Parsed]) -> bool:
+        """
+        Diff a parsed payload against the last one and emit change signals.
+
+        Returns False when the payload is unusable (request failed, not an object, or
+        missing show_tile_numbers), which counts as a failure for backoff.
+        """
+        self._in_flight = False
+        if parsed is None:
+            return False
+        fields, tiles = parsed
+
+        show_numbers = fields[0]
+        if self._last_value is None or show_numbers != self._last_value:
+            self._last_value = show_numbers
+            self.valueChanged.emit(show_numbers)
+
+        # Snapshots are only built when a field actually changed.
+        if fields != self._last_fields:
+            self._last_fields = fields
+            snap = UiSettingsSnapshot(*fields)
+            self._last_settings = snap
+            self.settingsChanged.emit(snap)
+
+        if tiles is not None and tiles != self._last_tiles:
+            self._last_tiles = tiles
+            self.tilesChanged.emit(tiles)
+        return True
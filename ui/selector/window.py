@@ -9,7 +9,7 @@ from __future__ import annotations
 
 from typing import Callable, Optional
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QRect, Qt
 from PySide6.QtGui import QColor, QPainter, QPen, QMoveEvent, QResizeEvent
 from PySide6.QtWidgets import QApplication, QWidget
 
@@ -19,7 +19,12 @@ from ui.selector.grid import GridGeometry
 from ui.selector.interaction import InteractionConfig, SelectorInteractor
 from ui.selector.paint import PaintConfig, SelectorPainter
 from ui.selector.region_emit import RegionEmitter
-from ui.selector.ui_settings import UiSettingsPoller, UiSettingsSnapshot
+from ui.selector.ui_settings import (
+    UiSettingsPoller,
+    UiSettingsSnapshot,
+    default_jitter_ms,
+    jittered_interval_ms,
+)
 from ui.tiles_sync import TilesSync
 from ui.selector.models import UiRegion
 
@@ -42,7 +47,7 @@ class SelectorWindow(QWidget):
     Lifecycle:
     - On init: sets initial geometry and emits initial region.
     - During interaction: on drag/move/resize emits updated region via RegionEmitter.
-    - Periodically: polls tiles (and optionally UI settings) and repaints on changes.
+    - While visible: polls tiles (and optionally UI settings) and repaints on changes.
     """
 
     def __init__(
@@ -65,6 +70,7 @@ class SelectorWindow(QWidget):
         chrome_bar_h_px: int = 20,
         ui_settings_url: Optional[str] = None,
         ui_poll_ms: int = 250,
+        poll_jitter_ms: Optional[int] = None,
         on_window_geometry_change: Optional[Callable[[int, int, int, int], None]] = None,
     ) -> None:
         super().__init__()
@@ -78,7 +84,7 @@ class SelectorWindow(QWidget):
         self._show_overlay_state = bool(show_overlay_state)
         self._current_state = "UNKNOWN"
 
-        # External tiles sync object (polls /tiles and exposes disabled_tiles set).
+        # External tiles sync object (polls /tiles and exposes a disabled_tiles frozenset).
         self._tiles_sync = tiles_sync
 
         # Tile label styling; background uses fixed translucent black.
@@ -124,6 +130,7 @@ class SelectorWindow(QWidget):
             border_px=int(border_px),
             emit_inset_px=int(emit_inset_px),
             chrome_bar_h_px=int(chrome_bar_h_px),
+            parent=self,
         )
 
         # Pointer interaction controller:
@@ -160,11 +167,22 @@ class SelectorWindow(QWidget):
         self._ui_poller: Optional[UiSettingsPoller] = None
         url = (ui_settings_url or "").strip()
         if url:
-            p = UiSettingsPoller(url=url, poll_ms=int(ui_poll_ms), timeout_sec=float(http_timeout_sec), parent=self)
+            # Shared per URL, so several overlays against one server poll it once per interval.
+            p = UiSettingsPoller.get_or_create(
+                url=url,
+                poll_ms=int(ui_poll_ms),
+                timeout_sec=float(http_timeout_sec),
+                poll_jitter_ms=poll_jitter_ms,
+            )
             p.valueChanged.connect(self.set_show_tile_numbers)  # type: ignore[arg-type]
             p.settingsChanged.connect(self.apply_ui_settings)  # type: ignore[arg-type]
+            p.tilesChanged.connect(self._apply_polled_tiles)  # type: ignore[arg-type]
             self._ui_poller = p
 
+        # Set once the settings poller delivers disabled_tiles (combined /ui/state endpoint);
+        # the separate tiles poll is then stopped.
+        self._tiles_from_ui_poller = False
+
         # Window chrome/flags: frameless + always-on-top tool window, transparent background.
         self.setWindowTitle("motiondetector grid")
         self.setWindowFlags(
@@ -177,25 +195,52 @@ class SelectorWindow(QWidget):
         # Required to receive mouse move events without pressing buttons.
         self.setMouseTracking(True)
 
+        # Re-query Win32 DPI when the native window moves to another screen or that screen's
+        # scaling changes; RegionEmitter only re-checks DPI after such an invalidation.
+        self._dpi_screen = None
+        try:
+            self.winId()
+            wh = self.windowHandle()
+            if wh is not None:
+                wh.screenChanged.connect(self._on_screen_changed)  # type: ignore[arg-type]
+                self._watch_screen_dpi(wh.screen())
+        except Exception:
+            pass
+
         # Apply initial geometry and emit initial region right away.
         self.setGeometry(initial.x, initial.y, initial.width, initial.height)
         self._notify_geometry_changed()
-        self._region_emitter.emit(reason="init")
+        self._region_emitter.flush_now(reason="init")
 
         # Local import avoids a module-level dependency chain in some setups.
         from PySide6.QtCore import QTimer
 
         # Tiles polling:
-        # The window requests tiles_sync.poll() on an interval and repaints if it changed.
+        # The window requests tiles_sync.poll() on a jittered interval (single-shot, re-armed
+        # per tick) and repaints if it changed.
+        self._tiles_poll_ms = int(tiles_poll_ms)
+        self._tiles_jitter_ms = default_jitter_ms(self._tiles_poll_ms, poll_jitter_ms)
         self._tiles_timer = QTimer(self)
-        self._tiles_timer.setInterval(int(tiles_poll_ms))
-        self._tiles_timer.timeout.connect(self._poll_tiles)  # type: ignore[arg-type]
-        self._tiles_timer.start()
-        self._poll_tiles()
+        self._tiles_timer.setSingleShot(True)
+        self._tiles_timer.timeout.connect(self._on_tiles_tick)  # type: ignore[arg-type]
+
+        # Painted bounds per tile layout: (inner, chrome bar rect, inner rect grown by the border).
+        # Paint requests touching neither are transparent margin only and skip painting.
+        self._paint_bounds: Optional[tuple[QRect, QRect, QRect]] = None
+
+        # Polling (tiles + UI settings) only runs while the overlay is visible; showEvent and
+        # hideEvent toggle it, so a hidden/minimized overlay costs no requests or wake-ups.
+        self._polling_active = False
 
-        # Start server-driven UI settings polling, if configured.
+        # A shared settings poller may already be running; replay its last snapshot since it
+        # only emits on change.
         if self._ui_poller is not None:
-            self._ui_poller.start()
+            last = self._ui_poller.last_settings
+            if last is not None:
+                self.apply_ui_settings(last)
+            last_tiles = self._ui_poller.last_tiles
+            if last_tiles is not None:
+                self._apply_polled_tiles(last_tiles)
 
     def set_show_tile_numbers(self, enabled: bool) -> None:
         """
@@ -216,11 +261,14 @@ class SelectorWindow(QWidget):
         """Grid size."""
         rr = max(1, int(rows))
         cc = max(1, int(cols))
+        if rr == self._grid.grid_rows and cc == self._grid.grid_cols:
+            return
         try:
             object.__setattr__(self._grid, "grid_rows", rr)
             object.__setattr__(self._grid, "grid_cols", cc)
             object.__setattr__(self._painter._cfg, "grid_rows", rr)
             object.__setattr__(self._painter._cfg, "grid_cols", cc)
+            self._painter.invalidate_caches()
         except Exception:
             return
 
@@ -256,7 +304,7 @@ class SelectorWindow(QWidget):
                     int(snapshot.region_height),
                 )
                 self._notify_geometry_changed()
-                self._region_emitter.emit(reason="ui-sync")
+                self._region_emitter.flush_now(reason="ui-sync")
         except Exception:
             pass
 
@@ -307,12 +355,67 @@ class SelectorWindow(QWidget):
             pass
         return screen_name, screen_logical, screen_phys
 
+    def _watch_screen_dpi(self, screen) -> None:
+        """Follow DPI changes of `screen` (and stop following the previous one)."""
+        old = self._dpi_screen
+        if old is screen:
+            return
+        if old is not None:
+            try:
+                old.logicalDotsPerInchChanged.disconnect(self._on_screen_dpi_changed)
+            except Exception:
+                pass
+        self._dpi_screen = screen
+        if screen is not None:
+            screen.logicalDotsPerInchChanged.connect(self._on_screen_dpi_changed)  # type: ignore[arg-type]
+
+    def _on_screen_changed(self, screen) -> None:
+        """The native window moved to another screen."""
+        self._watch_screen_dpi(screen)
+        self._region_emitter.invalidate_dpi_cache()
+
+    def _on_screen_dpi_changed(self, _dpi: float) -> None:
+        """The current screen's scaling changed."""
+        self._region_emitter.invalidate_dpi_cache()
+
     def moveEvent(self, event: QMoveEvent) -> None:  # type: ignore[override]
         _ = event
 
     def resizeEvent(self, event: QResizeEvent) -> None:  # type: ignore[override]
         _ = event
 
+    def showEvent(self, event) -> None:  # type: ignore[override]
+        """Start polling when the overlay becomes visible."""
+        super().showEvent(event)
+        self._set_polling(True)
+
+    def hideEvent(self, event) -> None:  # type: ignore[override]
+        """Stop polling while the overlay is hidden or minimized."""
+        super().hideEvent(event)
+        self._set_polling(False)
+
+    def _set_polling(self, active: bool) -> None:
+        """
+        Start/stop tiles and UI settings polling.
+
+        Starting polls tiles immediately (unless the combined settings poll delivers them)
+        and resumes the shared settings poller; stopping pauses it, so other visible
+        overlays sharing it keep their updates.
+        """
+        if active == self._polling_active:
+            return
+        self._polling_active = active
+        p = self._ui_poller
+        if active:
+            if not self._tiles_from_ui_poller:
+                self._on_tiles_tick()
+            if p is not None:
+                p.resume()
+        else:
+            self._tiles_timer.stop()
+            if p is not None:
+                p.pause()
+
     def closeEvent(self, event) -> None:  # type: ignore[override]
         """
         Qt close event.
@@ -320,12 +423,19 @@ class SelectorWindow(QWidget):
         Stops timers/pollers and then propagates the close signal via _on_close.
         """
         try:
-            self._tiles_timer.stop()
+            self._set_polling(False)
         except Exception:
             pass
+        # A coalesced drag emit must not fire against a closed window.
+        self._region_emitter.cancel()
         try:
             if self._ui_poller is not None:
-                self._ui_poller.stop()
+                p = self._ui_poller
+                self._ui_poller = None
+                p.release()
+                p.valueChanged.disconnect(self.set_show_tile_numbers)
+                p.settingsChanged.disconnect(self.apply_ui_settings)
+                p.tilesChanged.disconnect(self._apply_polled_tiles)
         except Exception:
             pass
         self._on_close()
@@ -335,11 +445,21 @@ class SelectorWindow(QWidget):
         """
         Qt paint event.
 
-        Uses GridGeometry to compute the inner rect and tile edges, then delegates to SelectorPainter.
+        Takes the inner rect and tile edges from the interactor's size-keyed layout cache, then
+        delegates to SelectorPainter. Requests that only cover the transparent margin between
+        the border and the window edge return before a QPainter is created.
         """
-        _ = event
+        inner, x_edges, y_edges = self._interact.tile_layout()
+        bounds = self._paint_bounds
+        if bounds is None or bounds[0] is not inner:
+            b = int(self._grid.border_px)
+            bounds = (inner, QRect(0, 0, self.width(), inner.top()), inner.adjusted(-b, -b, b, b))
+            self._paint_bounds = bounds
+        region = event.region()
+        if not region.intersects(bounds[1]) and not region.intersects(bounds[2]):
+            return
+
         p = QPainter(self)
-        inner, x_edges, y_edges = self._grid.tile_rects(widget_rect=self.rect())
         self._painter.paint(
             p,
             widget_w=self.width(),
@@ -348,7 +468,8 @@ class SelectorWindow(QWidget):
             x_edges=x_edges,
             y_edges=y_edges,
             show_tile_numbers=self._show_tile_numbers,
-            disabled_tiles=set(self._tiles_sync.disabled_tiles),
+            disabled_tiles=self._tiles_sync.disabled_tiles,
+            disabled_mask=self._tiles_sync.disabled_mask,
             show_overlay_state=self._show_overlay_state,
             current_state=self._current_state,
         )
@@ -370,6 +491,10 @@ class SelectorWindow(QWidget):
             # overlay visuals to lag behind server state until another repaint trigger occurred
             # (e.g. mouse move, timer-driven poll change, resize).
             self.update()
+            # A toggle may have changed tiles locally; make the combined poll re-deliver the
+            # server's list so a failed write is reconciled.
+            if self._tiles_from_ui_poller and self._ui_poller is not None:
+                self._ui_poller.forget_tiles()
             return
 
     def mouseMoveEvent(self, event) -> None:  # type: ignore[override]
@@ -377,22 +502,24 @@ class SelectorWindow(QWidget):
         Mouse move routing.
 
         Order matters:
-        1) Update chrome hover (close button) and repaint if hover changed.
-        2) If dragging, update geometry + emit region and repaint.
+        1) Update chrome hover (close button); repaint just the button if hover changed.
+        2) If dragging, queue the new geometry (applied and emitted by the interactor's ~16 ms timer).
         3) Otherwise, update cursor shape based on hover/hit-test state.
+
+        Drag moves do not repaint here: the widget only changes once the coalesced geometry is
+        applied, and Qt repaints a resized window itself (a pure move needs no repaint at all).
+        Hover only restyles the close button, so the update is limited to its rect.
         """
         pos = event.position().toPoint()
         global_pos = event.globalPosition().toPoint()
 
-        if self._interact.update_hover(pos):
-            self.update()
+        hover_changed = self._interact.update_hover(pos)
 
-        moved = self._interact.on_mouse_move(pos=pos, global_pos=global_pos)
-        if moved:
-            self.update()
-            return
+        if not self._interact.on_mouse_move(pos=pos, global_pos=global_pos):
+            self._interact.set_cursor_for(pos=pos)
 
-        self._interact.set_cursor_for(pos=pos)
+        if hover_changed:
+            self.update(self._interact.close_button_rect())
 
     def mouseReleaseEvent(self, event) -> None:  # type: ignore[override]
         """
@@ -404,6 +531,30 @@ class SelectorWindow(QWidget):
         self._interact.on_mouse_release()
         self._notify_geometry_changed()
 
+    def _schedule_tiles_poll(self) -> None:
+        """Arm the tiles timer for the next (jittered) tick."""
+        self._tiles_timer.start(jittered_interval_ms(self._tiles_poll_ms, self._tiles_jitter_ms))
+
+    def _on_tiles_tick(self) -> None:
+        """Tiles timer slot: poll, then reschedule (unless the combined poll took over)."""
+        if self._tiles_from_ui_poller:
+            return
+        self._poll_tiles()
+        self._schedule_tiles_poll()
+
+    def _apply_polled_tiles(self, tiles: object) -> None:
+        """
+        Slot for UiSettingsPoller.tilesChanged.
+
+        The first delivery means the settings endpoint also carries tiles, so the separate
+        tiles poll is stopped: one request and one repaint trigger per cycle.
+        """
+        if not self._tiles_from_ui_poller:
+            self._tiles_from_ui_poller = True
+            self._tiles_timer.stop()
+        if self._tiles_sync.apply_remote(tiles):
+            self.update()
+
     def _poll_tiles(self) -> None:
         """
         Poll the tiles endpoint and repaint if the disabled_tiles set changed.
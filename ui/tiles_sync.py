@@ -4,27 +4,51 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import json
-from typing import Optional, Set
+from typing import FrozenSet, Optional, Set, Union
 from urllib.request import Request, urlopen
 
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional dependency at runtime
+    orjson = None
 
-def http_get_json(url: str, *, timeout_sec: float) -> Optional[dict]:
+
+def _loads(raw: bytes) -> object:
+    """
+    Parse a JSON body from bytes.
+
+    Uses orjson (parses bytes directly) when available; falls back to stdlib json with
+    lenient UTF-8 decoding, which is also the retry path for bodies orjson rejects.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except Exception:
+            pass
+    return json.loads(raw.decode("utf-8", errors="replace"))
+
+
+def http_get_json(url: Union[str, Request], *, timeout_sec: float) -> Optional[dict]:
     """
     Perform a simple HTTP GET and parse the response body as JSON.
 
+    `url` may be a prebuilt GET Request, so pollers can reuse one instead of re-parsing
+    the URL and rebuilding headers on every call.
+
     Returns:
         - dict on success (only if the decoded JSON top-level is an object)
         - None on any error (network, timeout, decode, parse, non-dict JSON)
 
     Notes:
     - Uses urllib from the stdlib to avoid adding runtime deps in the UI layer.
-    - Decodes as UTF-8 with replacement to tolerate minor encoding issues.
+    - Parses with orjson when available; falls back to UTF-8 with replacement to tolerate
+      minor encoding issues.
     """
     try:
-        req = Request(url=url, method="GET")
+        req = url if isinstance(url, Request) else Request(url=url, method="GET")
         with urlopen(req, timeout=timeout_sec) as resp:
             raw = resp.read()
-        data = json.loads(raw.decode("utf-8", errors="replace"))
+        data = _loads(raw)
         return data if isinstance(data, dict) else None
     except Exception:
         return None
@@ -46,7 +70,7 @@ def http_put_json(url: str, *, payload: dict, timeout_sec: float) -> Optional[di
         req = Request(url=url, data=body, method="PUT", headers={"Content-Type": "application/json"})
         with urlopen(req, timeout=timeout_sec) as resp:
             raw = resp.read()
-        data = json.loads(raw.decode("utf-8", errors="replace"))
+        data = _loads(raw)
         return data if isinstance(data, dict) else None
     except Exception:
         return None
@@ -77,6 +101,7 @@ class TilesSync:
 
     Local behavior:
     - poll(): fetches server state and updates local disabled_tiles; returns True if changed.
+    - apply_remote(raw): same update from a list fetched by another poller.
     - toggle(idx0): optimistically flips a single tile and sends updated set via PUT.
 
     Concurrency model:
@@ -86,20 +111,45 @@ class TilesSync:
     def __init__(self, cfg: TilesSyncConfig) -> None:
         """Initialize this object with the provided inputs and prepare its internal state."""
         self._cfg = cfg
-        self._disabled_tiles: Set[int] = set()
+        # Immutable snapshot, replaced (never mutated) on change so it can be handed out
+        # without copying on every repaint.
+        self._disabled_tiles: FrozenSet[int] = frozenset()
+
+        # URL and headers never change after construction; poll() reuses this GET request.
+        self._get_req = Request(url=cfg.tiles_url, method="GET")
+
+        # Bitmask mirror of _disabled_tiles (bit i set == tile i disabled); updated on every change
+        # so painters get O(1) membership and a cheap hashable cache key.
+        self._disabled_mask = 0
 
         # True while a toggle() PUT is in progress.
         # poll() will not run while inflight to avoid overwriting optimistic state mid-request.
         self._inflight = False
 
     @property
-    def disabled_tiles(self) -> Set[int]:
+    def disabled_tiles(self) -> FrozenSet[int]:
         """
         Current disabled tile indices (0-based).
 
-        Returned as a copy so callers cannot mutate internal state inadvertently.
+        Returned as the internal frozenset: immutable, so callers cannot mutate internal
+        state, and no per-call copy is needed.
         """
-        return set(self._disabled_tiles)
+        return self._disabled_tiles
+
+    @property
+    def disabled_mask(self) -> int:
+        """
+        Current disabled tiles as a bitmask (bit i set == tile i disabled).
+        """
+        return self._disabled_mask
+
+    def _set_disabled(self, tiles: Set[int]) -> None:
+        """Replace the disabled set and refresh its bitmask mirror."""
+        mask = 0
+        for i in tiles:
+            mask |= 1 << i
+        self._disabled_tiles = frozenset(tiles)
+        self._disabled_mask = mask
 
     @property
     def inflight(self) -> bool:
@@ -123,19 +173,26 @@ class TilesSync:
         if self._inflight:
             return False
 
-        data = http_get_json(self._cfg.tiles_url, timeout_sec=self._cfg.timeout_sec)
+        data = http_get_json(self._get_req, timeout_sec=self._cfg.timeout_sec)
         if not data:
             return False
 
-        raw = data.get("disabled_tiles")
-        if not isinstance(raw, list):
+        return self.apply_remote(data.get("disabled_tiles"))
+
+    def apply_remote(self, raw: object) -> bool:
+        """
+        Adopt a server-provided disabled_tiles list fetched elsewhere (e.g. the combined
+        /ui/state poll). Same validation and inflight rule as poll(); returns True if changed.
+        """
+        if self._inflight or not isinstance(raw, (list, tuple)):
             return False
 
         n = self._cfg.grid_rows * self._cfg.grid_cols
         new_set: Set[int] = {int(v) for v in raw if isinstance(v, int) and 0 <= int(v) < n}
 
         changed = new_set != self._disabled_tiles
-        self._disabled_tiles = new_set
+        if changed:
+            self._set_disabled(new_set)
         return changed
 
     def toggle(self, idx0: int) -> bool:
@@ -166,7 +223,7 @@ class TilesSync:
             next_set.add(idx0)
 
         # Optimistic UI update: reflects the user's click immediately.
-        self._disabled_tiles = next_set
+        self._set_disabled(next_set)
 
         self._inflight = True
         try:
@@ -179,7 +236,7 @@ class TilesSync:
             # If the server responds with a valid list, treat it as authoritative.
             if isinstance(res, dict) and isinstance(res.get("disabled_tiles"), list):
                 raw = res.get("disabled_tiles")
-                self._disabled_tiles = {int(v) for v in raw if isinstance(v, int) and 0 <= int(v) < n}
+                self._set_disabled({int(v) for v in raw if isinstance(v, int) and 0 <= int(v) < n})
         finally:
             self._inflight = False
 
@@ -46,6 +46,23 @@ class WinRect:
         return int(self.bottom - self.top)
 
 
+def get_client_origin_in_screen_px(hwnd: int) -> tuple[int, int]:
+    """
+    Return the window client origin (0,0) in *physical screen pixels* (virtual-desktop coordinates).
+
+    One ClientToScreen call; callers that already know the client size (e.g. during a
+    move-only drag) can use this instead of get_client_rect_in_screen_px.
+
+    Raises:
+        OSError: if ClientToScreen fails (e.g., invalid hwnd, destroyed window).
+    """
+    pt = wintypes.POINT(0, 0)
+    ok = bool(_user32.ClientToScreen(wintypes.HWND(hwnd), ctypes.byref(pt)))
+    if not ok:
+        raise OSError("ClientToScreen failed")
+    return int(pt.x), int(pt.y)
+
+
 def get_client_rect_in_screen_px(hwnd: int) -> WinRect:
     """
     Return the window client rect as *physical screen pixels* in virtual-desktop coordinates.
@@ -70,14 +87,9 @@ def get_client_rect_in_screen_px(hwnd: int) -> WinRect:
         raise OSError("GetClientRect failed")
 
     # Convert the client origin (0,0) to screen coordinates.
-    pt = wintypes.POINT(0, 0)
-    ok = bool(_user32.ClientToScreen(wintypes.HWND(hwnd), ctypes.byref(pt)))
-    if not ok:
-        raise OSError("ClientToScreen failed")
+    left, top = get_client_origin_in_screen_px(hwnd)
 
     # Build the screen-space rect using the translated origin plus the client size.
-    left = int(pt.x)
-    top = int(pt.y)
     right = left + int(rc.right - rc.left)
     bottom = top + int(rc.bottom - rc.top)
     return WinRect(left=left, top=top, right=right, bottom=bottom)